@@ -20,11 +20,16 @@ from typing import (
     Literal,
     TypedDict,
     NotRequired,
+    TYPE_CHECKING,
 )
 from enum import Enum
 from datetime import datetime
 from pydantic import BaseModel, Field, HttpUrl, field_validator, ConfigDict, ValidationInfo
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 
 # ==========================================
 # ==========================================
@@ -75,7 +80,8 @@ JSONDict: TypeAlias = Dict[str, Any]
 JobID: TypeAlias = str
 PointID: TypeAlias = str
 CollectionName: TypeAlias = str
-EmbeddingVector: TypeAlias = List[float]
+EmbeddingVector: TypeAlias = "NDArray[np.float32]"
+EmbeddingMatrix: TypeAlias = "NDArray[np.float32]"
 Timestamp: TypeAlias = str
 
 
@@ -175,6 +181,7 @@ class CrawlWebRequest(BaseModel):
     max_pages: int = Field(10, ge=1, le=100, description="Maximum pages to crawl")
     allowed_domains: Optional[List[str]] = Field(None, description="Allowed domains list")
     max_depth: int = Field(2, ge=1, le=5, description="Maximum crawl depth")
+    force_refresh: bool = Field(False, description="Ingest unchanged pages again")
 
     @field_validator("allowed_domains", mode="before")
     @classmethod
@@ -259,6 +266,7 @@ class CrawlWebResponse(BaseModel):
     message: Optional[str] = None
     job_id: Optional[JobID] = None
     pages_crawled: int
+    pages_unchanged: Optional[int] = None
     source_url: Optional[str] = None
     check_status_endpoint: Optional[str] = None
     error: Optional[str] = None
@@ -274,6 +282,7 @@ class IngestDocResponse(BaseModel):
     source_name: Optional[str] = None
     file_format: Optional[str] = None
     content_length: Optional[int] = None
+    chunks: Optional[int] = None
     page_count: Optional[int] = None
     check_status_endpoint: Optional[str] = None
     error: Optional[str] = None
@@ -100,13 +100,13 @@ class CircuitBreakerUser(HttpUser):
             if response.status_code == 200:
                 try:
                     data = response.json()
-                    if "circuit_breakers" in data:
-                        cb_state = data["circuit_breakers"].get("orchestrator", {})
+                    # One breaker per orchestrator endpoint class
+                    for name, cb_state in data.get("circuit_breakers", {}).items():
                         state = cb_state.get("state", "unknown")
 
                         events.request.fire(
                             request_type="GET",
-                            name=f"circuit_breaker_state_{state}",
+                            name=f"{name}_state_{state}",
                             response_time=0,
                             response_length=0,
                             exception=None,
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Shield MCP Server Startup Benchmark
+
+Measures, against a deployed server (rendered templates + venv):
+1. Import time of shield_mcp_server (median of --runs fresh interpreters),
+   and whether the deferred heavy stacks (crawl4ai, docling) got imported
+2. Time to first request: process start until GET /metrics answers 200
+3. Idle RSS of the server process (and its Docling worker children) after
+   --settle seconds
+
+With --baseline, results are compared with a stored run and the script
+exits 1 when a metric regressed by more than --tolerance, or when a heavy
+stack is imported at module import time again.
+
+Usage (on the MCP server host, as the service user):
+    python3 tests/scripts/benchmark_startup.py --baseline startup-baseline.json
+    python3 tests/scripts/benchmark_startup.py --baseline startup-baseline.json --update-baseline
+
+Only uses the standard library; Linux only (RSS is read from /proc).
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Imported on first use only (see shield_mcp_server.py "Third-party imports")
+DEFERRED_MODULES = ("crawl4ai", "docling")
+
+# Metrics compared against the baseline (lower is better)
+GUARDED_METRICS = ("import_seconds", "first_request_seconds", "idle_rss_mb")
+
+IMPORT_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import shield_mcp_server
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": sorted(name for name in {DEFERRED_MODULES!r} if name in sys.modules)
+}}))
+"""
+
+
+def load_env_file(path: Path) -> Dict[str, str]:
+    """Parse the deployed .env file (KEY=VALUE lines, as used by systemd)"""
+    env: Dict[str, str] = {}
+    if not path.is_file():
+        return env
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        env[key.strip()] = value.strip()
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mb(pid: int) -> float:
+    """Resident set size of one process in MiB"""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024.0
+    return 0.0
+
+
+def child_pids(pid: int) -> List[int]:
+    children: List[int] = []
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        children_file = task / "children"
+        if children_file.is_file():
+            children.extend(int(child) for child in children_file.read_text().split())
+    return children
+
+
+def measure_import(python: str, app_dir: Path, env: Dict[str, str], runs: int) -> Dict[str, object]:
+    """Median import time of the server module in fresh interpreters"""
+    timings: List[float] = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [python, "-c", IMPORT_PROBE],
+            cwd=app_dir, env=env, capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(output)
+        timings.append(result["seconds"])
+        loaded = result["loaded"]
+    return {
+        "import_seconds": round(statistics.median(timings), 4),
+        "import_seconds_runs": [round(t, 4) for t in timings],
+        "deferred_modules_loaded_at_import": loaded
+    }
+
+
+def measure_server(
+    python: str,
+    app_dir: Path,
+    env: Dict[str, str],
+    ready_timeout: float,
+    settle: float
+) -> Dict[str, object]:
+    """Start the server, time the first successful request, then sample idle RSS"""
+    port = free_port()
+    env = {**env, "FASTMCP_PORT": str(port)}
+    url = f"http://127.0.0.1:{port}/metrics"
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [python, str(app_dir / "shield_mcp_server.py")],
+        cwd=app_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        first_request: Optional[float] = None
+        while time.perf_counter() - start < ready_timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited during startup (code {process.returncode})")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        first_request = time.perf_counter() - start
+                        break
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                time.sleep(0.05)
+        if first_request is None:
+            raise RuntimeError(f"server did not answer {url} within {ready_timeout}s")
+
+        time.sleep(settle)
+        children = child_pids(process.pid)
+        return {
+            "first_request_seconds": round(first_request, 4),
+            "idle_rss_mb": round(rss_mb(process.pid), 1),
+            "children_rss_mb": round(sum(rss_mb(child) for child in children), 1),
+            "children": len(children)
+        }
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def compare(results: Dict[str, object], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    """Regressions of results against baseline (empty list if none)"""
+    regressions: List[str] = []
+    for metric in GUARDED_METRICS:
+        if metric not in baseline or metric not in results:
+            continue
+        limit = float(baseline[metric]) * (1.0 + tolerance)
+        if float(results[metric]) > limit:
+            regressions.append(
+                f"{metric}: {results[metric]} > {round(limit, 4)} (baseline {baseline[metric]}, +{tolerance:.0%})"
+            )
+    if results.get("deferred_modules_loaded_at_import"):
+        regressions.append(
+            f"deferred modules imported at module import time: {results['deferred_modules_loaded_at_import']}"
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Shield MCP server startup benchmark")
+    parser.add_argument("--app-dir", type=Path, default=Path("/opt/fastmcp/shield"))
+    parser.add_argument("--python", default=None, help="Interpreter (default: <app-dir>/venv/bin/python3)")
+    parser.add_argument("--runs", type=int, default=5, help="Import-time runs (median is reported)")
+    parser.add_argument("--ready-timeout", type=float, default=60.0)
+    parser.add_argument("--settle", type=float, default=5.0, help="Seconds to wait before sampling idle RSS")
+    parser.add_argument("--warmup", choices=("true", "false"), default=None,
+                        help="Override WARMUP_ENABLED from the .env file")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline JSON to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="Write results to --baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression (0.2 = +20%%)")
+    args = parser.parse_args()
+
+    python = args.python or str(args.app_dir / "venv" / "bin" / "python3")
+    env = {**os.environ, **load_env_file(args.app_dir / ".env")}
+    if args.warmup is not None:
+        env["WARMUP_ENABLED"] = args.warmup
+
+    results: Dict[str, object] = {"warmup_enabled": env.get("WARMUP_ENABLED", "unset")}
+    results.update(measure_import(python, args.app_dir, env, args.runs))
+    results.update(measure_server(python, args.app_dir, env, args.ready_timeout, args.settle))
+    print(json.dumps(results, indent=2))
+
+    if args.baseline is None:
+        return 0
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
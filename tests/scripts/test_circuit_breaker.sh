@@ -31,7 +31,7 @@ echo ""
 # Test 2: Check circuit breaker is initialized
 echo "TEST 2: Circuit Breaker Initialization"
 echo "----------------------------------------"
-if ssh agent0@$SERVER "grep -q 'orchestrator_breaker = pybreaker.CircuitBreaker' /opt/fastmcp/shield/shield_mcp_server.py" 2>/dev/null; then
+if ssh agent0@$SERVER "grep -q 'orchestrator_breakers: Dict\[str, AsyncCircuitBreaker\]' /opt/fastmcp/shield/shield_mcp_server.py" 2>/dev/null; then
     echo "✅ Circuit breaker configured in code"
 else
     echo "❌ Circuit breaker not found in code"
@@ -39,13 +39,13 @@ else
 fi
 echo ""
 
-# Test 3: Verify pybreaker is installed
-echo "TEST 3: PyBreaker Dependency"
+# Test 3: Verify async circuit breaker module is deployed
+echo "TEST 3: Async Circuit Breaker Module"
 echo "----------------------------------------"
-if ssh agent0@$SERVER "/opt/fastmcp/shield/venv/bin/pip show pybreaker" > /dev/null 2>&1; then
-    echo "✅ PyBreaker installed"
+if ssh agent0@$SERVER "test -f /opt/fastmcp/shield/async_circuit_breaker.py" > /dev/null 2>&1; then
+    echo "✅ async_circuit_breaker.py deployed"
 else
-    echo "❌ PyBreaker not installed"
+    echo "❌ async_circuit_breaker.py not deployed"
     ((FAILURES++))
 fi
 echo ""
@@ -89,7 +89,7 @@ echo ""
 echo "TEST 7: Circuit Breaker Configuration"
 echo "----------------------------------------"
 if ssh agent0@$SERVER "grep -qE '(fail_max|reset_timeout|success_threshold)' /opt/fastmcp/shield/shield_mcp_server.py" 2>/dev/null; then
-    echo "✅ Circuit breaker configured: fail_max=5, reset_timeout=60, success_threshold=1"
+    echo "✅ Circuit breakers configured per orchestrator endpoint class (fail_max, reset_timeout, success_threshold)"
 else
     echo "❌ Circuit breaker parameters not found"
     ((FAILURES++))
@@ -154,3 +154,122 @@ def temp_file():
     yield tmp_path
     if os.path.exists(tmp_path):
         os.unlink(tmp_path)
+
+@pytest.fixture(scope="session")
+def mcp_template_module():
+    """
+    Load a Shield MCP server helper template as a Python module.
+    
+    Helper templates under roles/fastmcp_server/templates/ only use Jinja
+    inside their module docstring, so they import without rendering.
+    Loaded modules are registered in sys.modules so templates that import
+    each other resolve to the same module objects.
+    
+    Usage:
+        def test_breaker(mcp_template_module):
+            breaker_module = mcp_template_module("async_circuit_breaker")
+    """
+    import importlib.util
+    from importlib.machinery import SourceFileLoader
+    from pathlib import Path
+    
+    templates_dir = Path(__file__).parent.parent.parent / "roles" / "fastmcp_server" / "templates"
+    
+    def _load(name: str):
+        if name in sys.modules:
+            return sys.modules[name]
+        loader = SourceFileLoader(name, str(templates_dir / f"{name}.py.j2"))
+        spec = importlib.util.spec_from_loader(name, loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            loader.exec_module(module)
+        except Exception:
+            del sys.modules[name]
+            raise
+        return module
+    
+    return _load
+
+@pytest.fixture(scope="session")
+def mcp_server_module(tmp_path_factory):
+    """
+    Render the Shield MCP server template with the role defaults and import it.
+    
+    Unlike the helper templates, shield_mcp_server.py.j2 uses Jinja for its
+    configuration defaults, so it is rendered (cache directories point into
+    a temporary home) before import. Tools are plain async functions on the
+    module; tests patch module globals (generate_embeddings, qdrant_manager,
+    ...) with monkeypatch. Skipped when the server's own dependencies
+    (fastmcp<3, qdrant-client, numpy) are not installed.
+    
+    Usage:
+        async def test_tool(mcp_server_module, monkeypatch):
+            result = await mcp_server_module.qdrant_store_batch(texts=["a"])
+    """
+    import importlib.util
+    import json
+    from importlib.machinery import SourceFileLoader
+    
+    fastmcp = pytest.importorskip("fastmcp")
+    if int(fastmcp.__version__.split(".")[0]) >= 3:
+        pytest.skip(f"fastmcp {fastmcp.__version__} installed, the MCP server targets fastmcp<3")
+    for dependency in ("jinja2", "yaml", "qdrant_client", "numpy", "structlog", "prometheus_client"):
+        pytest.importorskip(dependency)
+    import jinja2
+    import yaml
+    
+    if "shield_mcp_server" in sys.modules:
+        return sys.modules["shield_mcp_server"]
+    
+    role_dir = Path(__file__).parent.parent.parent / "roles" / "fastmcp_server"
+    render_dir = tmp_path_factory.mktemp("mcp_server")
+    
+    variables = yaml.safe_load((role_dir / "defaults" / "main.yml").read_text())
+    variables.update(
+        ansible_hostname="pytest",
+        fastmcp_user_home=str(render_dir / "home"),
+        qdrant_url="http://127.0.0.1:6333",
+        qdrant_api_key="",
+        ollama_base_url="http://127.0.0.1:11434",
+        orchestrator_base_url="http://127.0.0.1:8000"
+    )
+    env = jinja2.Environment(undefined=jinja2.StrictUndefined)
+    env.filters["to_json"] = json.dumps
+    for name, value in list(variables.items()):
+        if isinstance(value, str) and "{{" in value and "hostvars" not in value:
+            variables[name] = env.from_string(value).render(**variables)
+    
+    # Helper modules the server imports resolve to the rendered copies next to it
+    for template in (role_dir / "templates").glob("*.py.j2"):
+        target = render_dir / template.name[:-len(".j2")]
+        target.write_text(env.from_string(template.read_text()).render(**variables))
+    sys.path.insert(0, str(render_dir))
+    
+    loader = SourceFileLoader("shield_mcp_server", str(render_dir / "shield_mcp_server.py"))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[loader.name] = module
+    try:
+        loader.exec_module(module)
+    except Exception:
+        del sys.modules[loader.name]
+        raise
+    return module
+
+@pytest.fixture
+def mcp_tool(mcp_server_module):
+    """
+    Look up an MCP server tool's underlying coroutine function by name.
+    
+    @mcp.tool() wraps functions in a FunctionTool (the function is its .fn).
+    
+    Usage:
+        async def test_tool(mcp_tool):
+            result = await mcp_tool("health_check")()
+    """
+    def _get(name: str):
+        tool = getattr(mcp_server_module, name)
+        return getattr(tool, "fn", tool)
+    
+    return _get
@@ -0,0 +1,191 @@
+"""
+Unit tests for the asyncio-native circuit breaker
+
+Tests the AsyncCircuitBreaker that protects orchestrator API calls in the
+Shield MCP server: state transitions, fast-fail behavior, half-open trial
+admission and recovery.
+
+Component Under Test:
+- fastmcp_server/templates/async_circuit_breaker.py.j2
+"""
+
+import asyncio
+import pytest
+from common_types import CircuitBreakerStateEnum
+
+
+@pytest.fixture
+def breaker_module(mcp_template_module):
+    """Load the async circuit breaker template module"""
+    return mcp_template_module("async_circuit_breaker")
+
+
+async def _fail():
+    raise RuntimeError("orchestrator down")
+
+
+async def _succeed():
+    return {"status": "ok"}
+
+
+@pytest.mark.unit
+@pytest.mark.circuit_breaker
+@pytest.mark.fast
+class TestAsyncCircuitBreakerStates:
+    """Test async circuit breaker state machine"""
+
+    async def test_initial_state_closed(self, breaker_module):
+        """Test breaker starts closed with no failures"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test")
+
+        assert breaker.current_state == CircuitBreakerStateEnum.CLOSED
+        assert breaker.fail_counter == 0
+
+    async def test_opens_after_fail_max(self, breaker_module):
+        """Test breaker opens after fail_max consecutive failures"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=3)
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await breaker.call(_fail)
+
+        assert breaker.current_state == CircuitBreakerStateEnum.OPEN
+        assert breaker.fail_counter == 3
+
+    async def test_success_resets_fail_counter(self, breaker_module):
+        """Test a success in CLOSED state clears consecutive failures"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=3)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await breaker.call(_fail)
+        assert await breaker.call(_succeed) == {"status": "ok"}
+
+        assert breaker.fail_counter == 0
+        assert breaker.current_state == CircuitBreakerStateEnum.CLOSED
+
+    async def test_fast_fail_when_open(self, breaker_module):
+        """Test open breaker rejects calls without awaiting the function"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=1, reset_timeout=60)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+        calls = 0
+
+        async def counted():
+            nonlocal calls
+            calls += 1
+
+        with pytest.raises(breaker_module.CircuitBreakerError):
+            await breaker.call(counted)
+        assert calls == 0
+
+    async def test_half_open_after_reset_timeout(self, breaker_module):
+        """Test breaker moves to HALF_OPEN and closes after a successful trial"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=1, reset_timeout=0.05)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+        await asyncio.sleep(0.06)
+        assert breaker.current_state == CircuitBreakerStateEnum.HALF_OPEN
+
+        await breaker.call(_succeed)
+        assert breaker.current_state == CircuitBreakerStateEnum.CLOSED
+        assert breaker.fail_counter == 0
+
+    async def test_failed_trial_reopens(self, breaker_module):
+        """Test a failed HALF_OPEN trial sends the breaker back to OPEN"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=1, reset_timeout=0.05)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+        await asyncio.sleep(0.06)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+        assert breaker.current_state == CircuitBreakerStateEnum.OPEN
+
+    async def test_half_open_admits_single_trial(self, breaker_module):
+        """Test concurrent callers fail fast while the trial call is in flight"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=1, reset_timeout=0.05)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        await asyncio.sleep(0.06)
+
+        release = asyncio.Event()
+
+        async def slow_trial():
+            await release.wait()
+            return "trial"
+
+        trial = asyncio.create_task(breaker.call(slow_trial))
+        await asyncio.sleep(0)
+
+        with pytest.raises(breaker_module.CircuitBreakerError):
+            await breaker.call(_succeed)
+
+        release.set()
+        assert await trial == "trial"
+        assert breaker.current_state == CircuitBreakerStateEnum.CLOSED
+
+
+@pytest.mark.unit
+@pytest.mark.circuit_breaker
+@pytest.mark.fast
+class TestAsyncCircuitBreakerBehavior:
+    """Test exception handling and listener notifications"""
+
+    async def test_excluded_exceptions_do_not_count(self, breaker_module):
+        """Test excluded exception types are re-raised without tripping the breaker"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=1, exclude=(KeyError,))
+
+        async def missing():
+            raise KeyError("job")
+
+        with pytest.raises(KeyError):
+            await breaker.call(missing)
+
+        assert breaker.current_state == CircuitBreakerStateEnum.CLOSED
+        assert breaker.fail_counter == 0
+
+    async def test_cancellation_does_not_count(self, breaker_module):
+        """Test cancelled calls are not recorded as failures"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", fail_max=1)
+
+        task = asyncio.create_task(breaker.call(asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert breaker.current_state == CircuitBreakerStateEnum.CLOSED
+
+    async def test_listener_receives_transitions(self, breaker_module):
+        """Test listener is called with (name, old_state, new_state)"""
+        transitions = []
+        breaker = breaker_module.AsyncCircuitBreaker(
+            name="orchestrator_api",
+            fail_max=1,
+            listener=lambda *args: transitions.append(args)
+        )
+
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        breaker.reset()
+
+        assert transitions == [
+            ("orchestrator_api", CircuitBreakerStateEnum.CLOSED, CircuitBreakerStateEnum.OPEN),
+            ("orchestrator_api", CircuitBreakerStateEnum.OPEN, CircuitBreakerStateEnum.CLOSED),
+        ]
+
+    async def test_trip_opens_for_remaining_time(self, breaker_module):
+        """Test trip() opens the circuit until the given remaining time has passed"""
+        breaker = breaker_module.AsyncCircuitBreaker(name="test", reset_timeout=60)
+
+        breaker.trip(0.05)
+
+        assert breaker.current_state == CircuitBreakerStateEnum.OPEN
+        assert 0 < breaker.seconds_until_half_open() <= 0.05
+        await asyncio.sleep(0.06)
+        assert breaker.current_state == CircuitBreakerStateEnum.HALF_OPEN
+        assert breaker.seconds_until_half_open() == 0.0
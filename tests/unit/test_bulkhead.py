@@ -0,0 +1,111 @@
+"""
+Unit tests for the bulkhead concurrency limiter
+
+Tests the Bulkhead that caps concurrent orchestrator calls per endpoint
+class in the Shield MCP server: concurrency limit, queue timeout rejection,
+slot release on errors and isolation between bulkheads.
+
+Component Under Test:
+- fastmcp_server/templates/bulkhead.py.j2
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def breaker_module(mcp_template_module):
+    """Load the async circuit breaker template module"""
+    return mcp_template_module("async_circuit_breaker")
+
+
+@pytest.fixture
+def bulkhead_module(mcp_template_module, breaker_module):
+    """Load the bulkhead template module (imports async_circuit_breaker)"""
+    return mcp_template_module("bulkhead")
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestBulkhead:
+    """Test per-endpoint-class concurrency limits"""
+
+    async def test_limits_concurrent_calls(self, bulkhead_module):
+        """Test no more than max_concurrent calls run at once"""
+        bulkhead = bulkhead_module.Bulkhead("query", max_concurrent=2, queue_timeout=5)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return "ok"
+
+        results = await asyncio.gather(*(bulkhead.call(work) for _ in range(6)))
+
+        assert results == ["ok"] * 6
+        assert peak == 2
+        stats = bulkhead.stats()
+        assert stats["peak_active"] == 2
+        assert stats["completed"] == 6
+        assert stats["active"] == 0
+
+    async def test_rejects_after_queue_timeout(self, bulkhead_module, breaker_module):
+        """Test a caller that cannot get a slot in time fails fast"""
+        bulkhead = bulkhead_module.Bulkhead("ingest", max_concurrent=1, queue_timeout=0.01)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        holder = asyncio.ensure_future(bulkhead.call(slow))
+        await asyncio.sleep(0)
+
+        with pytest.raises(bulkhead_module.BulkheadFullError) as exc_info:
+            await bulkhead.call(slow)
+
+        # Tools already fail fast on CircuitBreakerError and handle this the same way
+        assert isinstance(exc_info.value, breaker_module.CircuitBreakerError)
+        assert bulkhead.stats()["rejected"] == 1
+
+        release.set()
+        await holder
+
+    async def test_slot_released_on_error(self, bulkhead_module):
+        """Test a failing call frees its slot"""
+        bulkhead = bulkhead_module.Bulkhead("jobs", max_concurrent=1, queue_timeout=0.01)
+
+        async def fail():
+            raise RuntimeError("orchestrator down")
+
+        with pytest.raises(RuntimeError):
+            await bulkhead.call(fail)
+
+        async def succeed():
+            return "ok"
+
+        assert await bulkhead.call(succeed) == "ok"
+
+    async def test_bulkheads_are_isolated(self, bulkhead_module):
+        """Test a saturated bulkhead does not block calls through another one"""
+        ingest = bulkhead_module.Bulkhead("ingest", max_concurrent=1, queue_timeout=0.01)
+        jobs = bulkhead_module.Bulkhead("jobs", max_concurrent=1, queue_timeout=0.01)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        async def fast():
+            return "ok"
+
+        holder = asyncio.ensure_future(ingest.call(slow))
+        await asyncio.sleep(0)
+
+        assert await jobs.call(fast) == "ok"
+
+        release.set()
+        await holder
@@ -0,0 +1,81 @@
+"""
+Unit tests for the MCP server document conversion cache
+
+Tests the content-addressed ConversionCache used by ingest_doc: file
+hashing, round trips, converter-version isolation, persistence across
+instances and size-bounded eviction.
+
+Component Under Test:
+- fastmcp_server/templates/conversion_cache.py.j2
+"""
+
+import hashlib
+import pytest
+
+
+@pytest.fixture
+def cache_module(mcp_template_module):
+    """Load the conversion cache template module"""
+    return mcp_template_module("conversion_cache")
+
+
+CONVERTED = {"markdown": "# Title\n\nBody", "page_count": 2, "title": "Title"}
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestConversionCache:
+    """Test conversion result caching"""
+
+    async def test_hash_matches_file_bytes(self, cache_module, tmp_path):
+        """Test the key is the sha256 of the file contents"""
+        document = tmp_path / "doc.pdf"
+        document.write_bytes(b"%PDF-1.7 fake")
+        cache = cache_module.ConversionCache(str(tmp_path / "cache"))
+
+        assert await cache.hash_file(str(document)) == hashlib.sha256(b"%PDF-1.7 fake").hexdigest()
+
+    async def test_miss_then_hit(self, cache_module, tmp_path):
+        """Test a stored result is returned and counted as a hit"""
+        cache = cache_module.ConversionCache(str(tmp_path), converter_version="docling-2.0")
+
+        assert await cache.get("ab" * 32) is None
+        await cache.put("ab" * 32, CONVERTED)
+
+        assert await cache.get("ab" * 32) == CONVERTED
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    async def test_converter_version_isolates_entries(self, cache_module, tmp_path):
+        """Test results from another converter version are not reused"""
+        old = cache_module.ConversionCache(str(tmp_path), converter_version="docling-1.0")
+        await old.put("cd" * 32, CONVERTED)
+
+        new = cache_module.ConversionCache(str(tmp_path), converter_version="docling-2.0")
+
+        assert await new.get("cd" * 32) is None
+
+    async def test_persists_across_instances(self, cache_module, tmp_path):
+        """Test a new cache instance finds entries written before"""
+        first = cache_module.ConversionCache(str(tmp_path))
+        await first.put("ef" * 32, CONVERTED)
+
+        second = cache_module.ConversionCache(str(tmp_path))
+
+        assert second.stats()["entries"] == 1
+        assert await second.get("ef" * 32) == CONVERTED
+
+    async def test_size_bound_evicts_oldest(self, cache_module, tmp_path):
+        """Test least recently used entries are removed once the bound is exceeded"""
+        entry_size = len(b'{"markdown": "xxxxxxxxxx"}')
+        cache = cache_module.ConversionCache(str(tmp_path), max_bytes=entry_size * 2)
+
+        for digest in ("01" * 32, "02" * 32, "03" * 32):
+            await cache.put(digest, {"markdown": "x" * 10})
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= entry_size * 2
+        assert await cache.get("01" * 32) is None
+        assert await cache.get("03" * 32) == {"markdown": "x" * 10}
@@ -0,0 +1,151 @@
+"""
+Unit tests for the MCP server crawl frontier
+
+Tests URL normalization, the depth-aware de-duplicating CrawlFrontier and
+the concurrent run_crawl loop used by crawl_web (max_pages, max_depth,
+per-host concurrency limits and failed-page handling).
+
+Component Under Test:
+- fastmcp_server/templates/crawl_frontier.py.j2
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def frontier_module(mcp_template_module):
+    """Load the crawl frontier template module"""
+    return mcp_template_module("crawl_frontier")
+
+
+def make_site(links):
+    """Fake fetch_page over a {url: [links]} site map, tracking concurrency"""
+    state = {"active": 0, "peak": 0, "fetched": []}
+
+    async def fetch_page(url, depth):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        state["fetched"].append(url)
+        if url not in links:
+            return None
+        return {"url": url, "depth": depth}, links[url]
+
+    return fetch_page, state
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestNormalizeUrl:
+    """Test URL normalization"""
+
+    def test_case_port_and_fragment(self, frontier_module):
+        """Test scheme/host case, default port and fragment are normalized away"""
+        normalize = frontier_module.normalize_url
+
+        assert normalize("HTTPS://Example.COM:443/Docs#intro") == "https://example.com/Docs"
+        assert normalize("http://example.com") == "http://example.com/"
+        assert normalize("http://example.com:8080/a?b=1") == "http://example.com:8080/a?b=1"
+
+    def test_relative_links_resolved(self, frontier_module):
+        """Test relative links are resolved against the page URL"""
+        normalize = frontier_module.normalize_url
+
+        assert normalize("../b", base="https://example.com/a/c") == "https://example.com/b"
+
+    def test_non_http_rejected(self, frontier_module):
+        """Test mailto/javascript links are not crawlable"""
+        normalize = frontier_module.normalize_url
+
+        assert normalize("mailto:team@example.com") is None
+        assert normalize("javascript:void(0)") is None
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestCrawlFrontier:
+    """Test enqueue rules"""
+
+    def test_dedupes_on_enqueue(self, frontier_module):
+        """Test equivalent URLs are queued once"""
+        frontier = frontier_module.CrawlFrontier(["example.com"], max_depth=2)
+
+        assert frontier.add("https://example.com/a", 0) is True
+        assert frontier.add("https://EXAMPLE.com/a#top", 1) is False
+        assert len(frontier) == 1
+
+    def test_depth_and_domain_limits(self, frontier_module):
+        """Test links beyond max_depth or outside allowed domains are dropped"""
+        frontier = frontier_module.CrawlFrontier(["example.com"], max_depth=1)
+
+        assert frontier.add("https://example.com/deep", 2) is False
+        assert frontier.add("https://other.org/", 1) is False
+        assert frontier.add("https://example.com/ok", 1) is True
+        assert frontier.pop() == ("https://example.com/ok", 1)
+        assert frontier.pop() is None
+
+    def test_allows_host_or_host_port(self, frontier_module):
+        """Test allowed_domains entries match a URL's host or host:port"""
+        frontier = frontier_module.CrawlFrontier(["Docs.example.com", "localhost:8080"], max_depth=1)
+
+        assert frontier.allows("https://docs.example.com:8443/guide")
+        assert frontier.allows("http://localhost:8080/")
+        assert not frontier.allows("http://localhost:9090/")
+        assert not frontier.allows("https://example.com/")
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestRunCrawl:
+    """Test the concurrent crawl loop"""
+
+    async def test_breadth_first_respects_max_depth(self, frontier_module):
+        """Test pages deeper than max_depth are never fetched"""
+        site = {
+            "https://example.com/": ["/a", "/b"],
+            "https://example.com/a": ["/a/deep"],
+            "https://example.com/b": ["/"],
+            "https://example.com/a/deep": [],
+        }
+        fetch_page, state = make_site(site)
+        frontier = frontier_module.CrawlFrontier(["example.com"], max_depth=1)
+        frontier.add("https://example.com/", 0)
+
+        pages = await frontier_module.run_crawl(frontier, fetch_page, max_pages=10)
+
+        assert sorted(page["url"] for page in pages) == [
+            "https://example.com/", "https://example.com/a", "https://example.com/b"
+        ]
+        assert "https://example.com/a/deep" not in state["fetched"]
+        assert len(state["fetched"]) == len(set(state["fetched"]))
+
+    async def test_max_pages_and_per_host_limit(self, frontier_module):
+        """Test crawling stops at max_pages and honours the per-host limit"""
+        site = {"https://example.com/": [f"/p{i}" for i in range(50)]}
+        site.update({f"https://example.com/p{i}": [] for i in range(50)})
+        fetch_page, state = make_site(site)
+        frontier = frontier_module.CrawlFrontier(["example.com"], max_depth=1)
+        frontier.add("https://example.com/", 0)
+
+        pages = await frontier_module.run_crawl(
+            frontier, fetch_page, max_pages=20, concurrency=8, per_host_concurrency=3
+        )
+
+        assert len(pages) == 20
+        assert state["peak"] == 3
+
+    async def test_failed_pages_do_not_count(self, frontier_module):
+        """Test failed fetches free their slot for another page"""
+        site = {"https://example.com/": ["/missing", "/ok"], "https://example.com/ok": []}
+        fetch_page, _ = make_site(site)
+        frontier = frontier_module.CrawlFrontier(["example.com"], max_depth=1)
+        frontier.add("https://example.com/", 0)
+
+        pages = await frontier_module.run_crawl(frontier, fetch_page, max_pages=2)
+
+        assert [page["url"] for page in pages] == ["https://example.com/", "https://example.com/ok"]
@@ -0,0 +1,147 @@
+"""
+Unit tests for the MCP server structure-aware document chunker
+
+Tests how ingest_doc splits converted documents: markdown block parsing,
+heading-aligned chunk boundaries, size bounds, splitting of oversized
+tables and paragraphs, and section / page metadata.
+
+Component Under Test:
+- fastmcp_server/templates/doc_chunker.py.j2
+"""
+
+import types
+
+import pytest
+
+
+@pytest.fixture
+def chunker_module(mcp_template_module):
+    """Load the document chunker template module"""
+    return mcp_template_module("doc_chunker")
+
+
+def block(kind, text, level=0, page=None):
+    return {"kind": kind, "text": text, "level": level, "page": page}
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestMarkdownBlocks:
+    """Test the markdown fallback parser"""
+
+    def test_block_kinds(self, chunker_module):
+        """Test headings, paragraphs, lists, tables and fenced code become separate blocks"""
+        markdown = "\n".join([
+            "# Title",
+            "Intro line one",
+            "line two",
+            "",
+            "- a",
+            "- b",
+            "| x | y |",
+            "|---|---|",
+            "| 1 | 2 |",
+            "```",
+            "code",
+            "",
+            "more code",
+            "```",
+            "<!-- image -->",
+            "## Part",
+        ])
+
+        blocks = list(chunker_module.markdown_blocks(markdown))
+
+        assert [(b["kind"], b["level"]) for b in blocks] == [
+            ("heading", 1), ("text", 0), ("list", 0), ("table", 0), ("code", 0), ("heading", 2)
+        ]
+        assert blocks[1]["text"] == "Intro line one\nline two"
+        assert blocks[4]["text"] == "```\ncode\n\nmore code\n```"
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestChunkBlocks:
+    """Test chunk boundaries, bounds and metadata"""
+
+    def test_headings_start_chunks_with_section_and_pages(self, chunker_module):
+        """Test each large enough section becomes its own chunk with its section path and pages"""
+        blocks = [
+            block("heading", "Guide", level=1, page=1),
+            block("text", "a" * 300, page=1),
+            block("heading", "Install", level=2, page=2),
+            block("text", "b" * 300, page=2),
+            block("text", "c" * 300, page=3),
+            block("heading", "Usage", level=2, page=4),
+            block("text", "d" * 300, page=4),
+        ]
+
+        chunks = list(chunker_module.chunk_blocks(blocks, max_chars=2000, min_chars=200))
+
+        assert [c["metadata"]["section"] for c in chunks] == ["Guide", "Guide > Install", "Guide > Usage"]
+        assert chunks[1]["text"].startswith("## Install\n\n")
+        assert (chunks[1]["metadata"]["page_start"], chunks[1]["metadata"]["page_end"]) == (2, 3)
+
+    def test_small_sections_are_merged(self, chunker_module):
+        """Test a heading does not split a chunk that is still below min_chars"""
+        blocks = [
+            block("heading", "A", level=1),
+            block("text", "short"),
+            block("heading", "B", level=1),
+            block("text", "also short"),
+        ]
+
+        chunks = list(chunker_module.chunk_blocks(blocks, max_chars=1000, min_chars=200))
+
+        assert len(chunks) == 1
+        assert chunks[0]["text"] == "# A\n\nshort\n\n# B\n\nalso short"
+
+    def test_chunks_bounded_and_heading_carried(self, chunker_module):
+        """Test no chunk exceeds max_chars and a heading is never left at the end of a chunk"""
+        blocks = [block("text", "x" * 500), block("heading", "Next", level=2), block("text", "y" * 500)]
+
+        chunks = list(chunker_module.chunk_blocks(blocks, max_chars=600, min_chars=1000))
+
+        assert all(len(c["text"]) <= 600 for c in chunks)
+        assert chunks[0]["text"] == "x" * 500
+        assert chunks[1]["text"].startswith("## Next")
+
+    def test_oversized_table_split_with_header(self, chunker_module):
+        """Test a large table is split by rows and every piece repeats the header"""
+        rows = ["| id | value |", "|----|-------|"] + [f"| {i} | {'v' * 30} |" for i in range(100)]
+        blocks = [block("table", "\n".join(rows), page=7)]
+
+        chunks = list(chunker_module.chunk_blocks(blocks, max_chars=500, min_chars=100))
+
+        assert len(chunks) > 1
+        assert all(c["text"].startswith("| id | value |\n|----|-------|\n") for c in chunks)
+        assert all(len(c["text"]) <= 500 for c in chunks)
+        body_rows = [row for c in chunks for row in c["text"].splitlines()[2:]]
+        assert body_rows == rows[2:]
+
+    def test_long_paragraph_split_at_sentences(self, chunker_module):
+        """Test oversized text is split at sentence boundaries"""
+        text = " ".join(f"Sentence number {i} ends here." for i in range(100))
+
+        chunks = list(chunker_module.chunk_blocks([block("text", text)], max_chars=300, min_chars=100))
+
+        assert all(len(c["text"]) <= 300 for c in chunks)
+        assert all(c["text"].endswith("ends here.") for c in chunks)
+        assert " ".join(c["text"] for c in chunks) == text
+
+    def test_lazy_generator(self, chunker_module):
+        """Test chunks are produced on demand from a block iterator"""
+        consumed = []
+
+        def blocks():
+            for i in range(1000):
+                consumed.append(i)
+                yield block("text", "z" * 100)
+
+        chunks = chunker_module.chunk_blocks(blocks(), max_chars=250, min_chars=100)
+
+        assert isinstance(chunks, types.GeneratorType)
+        next(chunks)
+        assert len(consumed) < 10
@@ -0,0 +1,209 @@
+"""
+Unit tests for the MCP server Docling conversion pool
+
+Tests the DocConverterPool used by ingest_doc: work runs in worker
+processes, a per-document timeout replaces only the stuck worker, and the
+pool keeps serving afterwards. Docling itself is not needed; stdlib
+functions stand in for the converter because spawned workers must be able
+to import whatever they run.
+
+Component Under Test:
+- fastmcp_server/templates/doc_converter_pool.py.j2
+"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def pool_module(mcp_template_module):
+    """Load the conversion pool template module"""
+    return mcp_template_module("doc_converter_pool")
+
+
+@pytest.fixture
+async def make_pool(pool_module):
+    """Factory for pools with stdlib stand-ins; closes them afterwards"""
+    pools = []
+
+    def _make(convert_func, **kwargs):
+        pool = pool_module.DocConverterPool(
+            convert_func=convert_func,
+            initializer=None,
+            warm_func=None,
+            **kwargs
+        )
+        pools.append(pool)
+        return pool
+
+    yield _make
+    for pool in pools:
+        await pool.close()
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.slow
+class TestDocConverterPool:
+    """Test process-pool conversion"""
+
+    async def test_converts_in_worker(self, make_pool):
+        """Test a document is converted by a pool worker and counted"""
+        pool = make_pool(os.path.basename, max_workers=1)
+
+        assert await pool.convert("/tmp/report.pdf") == "report.pdf"
+        assert pool.stats()["conversions"] == 1
+
+    async def test_concurrent_conversions_bounded_by_workers(self, make_pool):
+        """Test conversions beyond max_workers queue instead of failing"""
+        pool = make_pool(os.path.basename, max_workers=2)
+
+        results = await asyncio.gather(*(pool.convert(f"/docs/{i}.pdf") for i in range(5)))
+
+        assert results == [f"{i}.pdf" for i in range(5)]
+        assert pool.stats()["idle_workers"] == 2
+
+    async def test_timeout_replaces_only_stuck_worker(self, make_pool):
+        """Test a timed-out document raises and the pool keeps working"""
+        pool = make_pool(time.sleep, max_workers=1, timeout=0.5)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.convert(30)
+
+        # The replacement worker spawns a new process; give it room on a slow runner
+        pool.timeout = 30
+        pool.convert_func = os.path.basename
+        assert await pool.convert("/data/ok.docx") == "ok.docx"
+
+        stats = pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["restarts"] == 1
+        assert stats["idle_workers"] == 1
+
+    async def test_worker_errors_propagate(self, make_pool):
+        """Test exceptions raised in the worker reach the caller"""
+        pool = make_pool(int, max_workers=1)
+
+        with pytest.raises(ValueError):
+            await pool.convert("not-a-number")
+        assert pool.stats()["restarts"] == 0
+
+    async def test_input_format_passed_to_worker(self, make_pool):
+        """Test the input format reaches convert_func only when given"""
+        pool = make_pool(os.path.join, max_workers=1)
+
+        assert await pool.convert("/docs/notes.txt", "md") == "/docs/notes.txt/md"
+        assert await pool.convert("/docs/notes") == "/docs/notes"
+
+
+class FakeLabel:
+    """Stand-in for Docling's DocItemLabel enum"""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class FakeItem:
+    """Stand-in for a Docling document item"""
+
+    def __init__(self, label, text="", level=1, page=None, table_markdown=None):
+        self.label = FakeLabel(label)
+        self.text = text
+        self.level = level
+        self.prov = [type("Prov", (), {"page_no": page})()] if page is not None else []
+        self._table_markdown = table_markdown
+
+    def export_to_markdown(self, doc=None):
+        return self._table_markdown
+
+
+class FakeDocument:
+    def __init__(self, items):
+        self.items = items
+
+    def iterate_items(self):
+        return ((item, 0) for item in self.items)
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestDocumentBlocks:
+    """Test Docling items are mapped to chunker blocks"""
+
+    def test_items_mapped_to_blocks(self, pool_module):
+        """Test headings, tables and list items keep level and page; page furniture is skipped"""
+        document = FakeDocument([
+            FakeItem("title", "Annual Report", page=1),
+            FakeItem("page_header", "ACME Corp", page=1),
+            FakeItem("section_header", "Revenue", level=1, page=2),
+            FakeItem("text", "Revenue grew.", page=2),
+            FakeItem("table", table_markdown="| q | r |\n|---|---|\n| 1 | 2 |", page=3),
+            FakeItem("list_item", "Europe", page=3),
+            FakeItem("picture", page=4),
+            FakeItem("text", "   ", page=4),
+        ])
+
+        blocks = pool_module.document_blocks(document)
+
+        assert [(b["kind"], b["level"], b["page"]) for b in blocks] == [
+            ("heading", 1, 1), ("heading", 2, 2), ("text", 0, 2), ("table", 0, 3), ("list", 0, 3)
+        ]
+        assert blocks[3]["text"].startswith("| q | r |")
+        assert blocks[4]["text"] == "- Europe"
+
+
+class FakeConverter:
+    """Stand-in for DocumentConverter recording the source it was given"""
+
+    def __init__(self):
+        self.sources = []
+
+    def convert(self, source, raises_on_error=False):
+        self.sources.append(source)
+        return SimpleNamespace(document=SimpleNamespace(
+            export_to_markdown=lambda: "# Notes", iterate_items=lambda: iter(()), page_count=1, title="Notes"
+        ))
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestConvertDocument:
+    """Test files are handed to Docling under the requested input format"""
+
+    @pytest.fixture
+    def converter(self, pool_module, monkeypatch):
+        converter = FakeConverter()
+        monkeypatch.setattr(pool_module, "_converter", converter)
+        base_models = SimpleNamespace(DocumentStream=lambda name, stream: SimpleNamespace(name=name, data=stream.read()))
+        for name, module in (
+            ("docling", SimpleNamespace()),
+            ("docling.datamodel", SimpleNamespace()),
+            ("docling.datamodel.base_models", base_models),
+        ):
+            monkeypatch.setitem(sys.modules, name, module)
+        return converter
+
+    def test_text_file_read_as_markdown(self, pool_module, converter, tmp_path):
+        """Test a .txt file is presented to Docling as .md"""
+        doc = tmp_path / "notes.txt"
+        doc.write_text("# Notes")
+
+        assert pool_module.convert_document(str(doc), "md")["markdown"] == "# Notes"
+        assert (converter.sources[0].name, converter.sources[0].data) == ("notes.md", b"# Notes")
+
+    def test_matching_extension_converted_by_path(self, pool_module, converter, tmp_path):
+        """Test files whose extension matches the format are converted from their path"""
+        doc = tmp_path / "Report.PDF"
+        doc.write_bytes(b"%PDF")
+
+        pool_module.convert_document(str(doc), "pdf")
+        pool_module.convert_document(str(doc))
+
+        assert converter.sources == [str(doc), str(doc)]
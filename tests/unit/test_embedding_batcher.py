@@ -0,0 +1,133 @@
+"""
+Unit tests for the MCP server embedding coalescer
+
+Tests the EmbeddingBatcher that groups concurrent embedding requests into
+one batched Ollama /api/embed call: window-based and size-based flushing,
+per-model batches, per-caller results and error propagation.
+
+Component Under Test:
+- fastmcp_server/templates/embedding_batcher.py.j2
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def batcher_module(mcp_template_module):
+    """Load the embedding batcher template module"""
+    return mcp_template_module("embedding_batcher")
+
+
+class RecordingEmbedder:
+    """Fake batch embedder that records each call"""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    async def __call__(self, model, texts):
+        self.calls.append((model, list(texts)))
+        if self.fail:
+            raise RuntimeError("ollama unavailable")
+        return [[float(len(text)), float(index)] for index, text in enumerate(texts)]
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestEmbeddingBatcherCoalescing:
+    """Test request coalescing"""
+
+    async def test_concurrent_requests_share_one_call(self, batcher_module):
+        """Test requests inside one window are sent as a single batch"""
+        embedder = RecordingEmbedder()
+        batcher = batcher_module.EmbeddingBatcher(embedder, window_ms=10, max_batch_size=32)
+
+        results = await asyncio.gather(
+            batcher.embed("m", "a"),
+            batcher.embed("m", "bb"),
+            batcher.embed("m", "ccc"),
+        )
+
+        assert embedder.calls == [("m", ["a", "bb", "ccc"])]
+        assert results == [[1.0, 0.0], [2.0, 1.0], [3.0, 2.0]]
+        assert batcher.stats()["batches"] == 1
+        assert batcher.stats()["avg_batch_size"] == 3.0
+
+    async def test_max_batch_size_flushes_immediately(self, batcher_module):
+        """Test a full batch is sent without waiting for the window"""
+        embedder = RecordingEmbedder()
+        batcher = batcher_module.EmbeddingBatcher(embedder, window_ms=10_000, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("m", "a"), batcher.embed("m", "b")),
+            timeout=1.0
+        )
+
+        assert len(results) == 2
+        assert embedder.calls == [("m", ["a", "b"])]
+
+    async def test_models_are_batched_separately(self, batcher_module):
+        """Test requests for different models never share a batch"""
+        embedder = RecordingEmbedder()
+        batcher = batcher_module.EmbeddingBatcher(embedder, window_ms=5)
+
+        await asyncio.gather(batcher.embed("m1", "a"), batcher.embed("m2", "b"))
+
+        assert sorted(embedder.calls) == [("m1", ["a"]), ("m2", ["b"])]
+
+    async def test_duplicate_texts_embedded_once(self, batcher_module):
+        """Test identical texts in a batch are sent once and fanned out"""
+        embedder = RecordingEmbedder()
+        batcher = batcher_module.EmbeddingBatcher(embedder, window_ms=5)
+
+        first, second = await asyncio.gather(batcher.embed("m", "same"), batcher.embed("m", "same"))
+
+        assert embedder.calls == [("m", ["same"])]
+        assert first == second
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestEmbeddingBatcherErrors:
+    """Test failure handling"""
+
+    async def test_batch_error_propagates_to_all_callers(self, batcher_module):
+        """Test every caller in a failed batch sees the error"""
+        batcher = batcher_module.EmbeddingBatcher(RecordingEmbedder(fail=True), window_ms=5)
+
+        results = await asyncio.gather(
+            batcher.embed("m", "a"),
+            batcher.embed("m", "b"),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_vector_count_mismatch_is_an_error(self, batcher_module):
+        """Test a short response from Ollama fails the batch"""
+        async def short(model, texts):
+            return [[0.0]]
+
+        batcher = batcher_module.EmbeddingBatcher(short, window_ms=5)
+
+        results = await asyncio.gather(
+            batcher.embed("m", "a"),
+            batcher.embed("m", "b"),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_close_flushes_pending(self, batcher_module):
+        """Test close() sends queued requests instead of waiting for the window"""
+        embedder = RecordingEmbedder()
+        batcher = batcher_module.EmbeddingBatcher(embedder, window_ms=10_000)
+
+        pending = asyncio.create_task(batcher.embed("m", "late"))
+        await asyncio.sleep(0)
+        await batcher.close()
+
+        assert await asyncio.wait_for(pending, timeout=1.0) == [4.0, 0.0]
@@ -0,0 +1,156 @@
+"""
+Unit tests for the MCP server embedding cache
+
+Tests the content-addressed EmbeddingCache used by generate_embedding():
+key derivation, LRU eviction in the memory tier, the optional on-disk tier
+with size-based eviction, and hit/miss accounting. Vectors are float32
+arrays (see test_embedding_vectors.py).
+
+Component Under Test:
+- fastmcp_server/templates/embedding_cache.py.j2
+"""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def vectors_module(mcp_template_module):
+    """Load the compact embedding vector helpers"""
+    return mcp_template_module("embedding_vectors")
+
+
+@pytest.fixture
+def cache_module(mcp_template_module, vectors_module):
+    """Load the embedding cache template module (imports embedding_vectors)"""
+    return mcp_template_module("embedding_cache")
+
+
+def vec(*values):
+    return np.array(values, dtype=np.float32)
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestEmbeddingCacheKeys:
+    """Test content-addressed cache keys"""
+
+    def test_key_depends_on_model_and_text(self, cache_module):
+        """Test same text under different models yields different keys"""
+        make_key = cache_module.EmbeddingCache.make_key
+
+        assert make_key("nomic-embed-text", "hello") == make_key("nomic-embed-text", "hello")
+        assert make_key("nomic-embed-text", "hello") != make_key("mxbai-embed-large", "hello")
+        assert make_key("nomic-embed-text", "hello") != make_key("nomic-embed-text", "hello!")
+
+    def test_key_uses_sha256_digest(self, cache_module):
+        """Test the text part of the key is a sha256 hex digest"""
+        model, digest = cache_module.EmbeddingCache.make_key("m", "hello")
+
+        assert model == "m"
+        assert digest == "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestEmbeddingCacheMemoryTier:
+    """Test the in-memory LRU tier"""
+
+    async def test_miss_then_hit(self, cache_module):
+        """Test a stored vector is returned and counted as a hit"""
+        cache = cache_module.EmbeddingCache(max_entries=10)
+
+        assert await cache.get("m", "query") is None
+        await cache.put("m", "query", vec(0.25, 0.5, 0.75))
+
+        assert (await cache.get("m", "query")).tolist() == [0.25, 0.5, 0.75]
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    async def test_lru_eviction(self, cache_module):
+        """Test least recently used entry is evicted first"""
+        cache = cache_module.EmbeddingCache(max_entries=2)
+        await cache.put("m", "a", vec(1.0))
+        await cache.put("m", "b", vec(2.0))
+
+        # Touch "a" so "b" becomes least recently used
+        assert (await cache.get("m", "a")).tolist() == [1.0]
+        await cache.put("m", "c", vec(3.0))
+
+        assert await cache.get("m", "b") is None
+        assert (await cache.get("m", "a")).tolist() == [1.0]
+        assert (await cache.get("m", "c")).tolist() == [3.0]
+        assert cache.stats()["memory_entries"] == 2
+
+    async def test_batch_rows_stored_compactly(self, cache_module, vectors_module):
+        """Test a cached row of a batch matrix does not keep the whole matrix alive"""
+        cache = cache_module.EmbeddingCache(max_entries=10)
+        matrix = vectors_module.to_matrix([[1.0, 2.0], [3.0, 4.0]])
+
+        await cache.put("m", "row", matrix[1])
+        cached = await cache.get("m", "row")
+
+        assert cached.base is None
+        assert cached.dtype == np.float32
+        assert cached.tolist() == [3.0, 4.0]
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestEmbeddingCacheDiskTier:
+    """Test the optional on-disk tier"""
+
+    async def test_disk_tier_survives_new_instance(self, cache_module, tmp_path):
+        """Test vectors written to disk are found by a fresh cache instance"""
+        first = cache_module.EmbeddingCache(max_entries=10, disk_dir=str(tmp_path))
+        await first.put("nomic-embed-text", "persist me", vec(0.25, -0.5, 1.0))
+
+        second = cache_module.EmbeddingCache(max_entries=10, disk_dir=str(tmp_path))
+        assert (await second.get("nomic-embed-text", "persist me")).tolist() == [0.25, -0.5, 1.0]
+
+        stats = second.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["disk_entries"] == 1
+        assert stats["memory_entries"] == 1
+
+    async def test_disk_tier_size_eviction(self, cache_module, tmp_path):
+        """Test oldest disk entries are removed once the byte bound is exceeded"""
+        vector = np.zeros(16, dtype=np.float32)  # 64 bytes as float32
+        cache = cache_module.EmbeddingCache(max_entries=1, disk_dir=str(tmp_path), disk_max_bytes=128)
+
+        for text in ("one", "two", "three"):
+            await cache.put("m", text, vector)
+
+        stats = cache.stats()
+        assert stats["disk_entries"] == 2
+        assert stats["disk_bytes"] <= 128
+        assert len(list(tmp_path.rglob("*.f32"))) == 2
+
+        # "one" was evicted from disk and memory holds only "three"
+        assert await cache.get("m", "one") is None
+        assert (await cache.get("m", "two")).tolist() == vector.tolist()
+
+    async def test_legacy_float64_entries_read(self, cache_module, tmp_path):
+        """Test .vec files written as float64 before float32 vectors are still served"""
+        cache = cache_module.EmbeddingCache(max_entries=10, disk_dir=str(tmp_path))
+        legacy = cache._disk_path(cache.make_key("m", "old"), ".vec")
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(np.array([0.5, -2.0], dtype="<f8").tobytes())
+
+        fresh = cache_module.EmbeddingCache(max_entries=10, disk_dir=str(tmp_path))
+        vector = await fresh.get("m", "old")
+
+        assert vector.dtype == np.float32
+        assert vector.tolist() == [0.5, -2.0]
+        assert fresh.stats()["disk_entries"] == 1
+
+    async def test_disk_disabled_by_default(self, cache_module):
+        """Test no disk tier is used unless a directory is configured"""
+        cache = cache_module.EmbeddingCache()
+
+        assert cache.stats()["disk_enabled"] is False
@@ -0,0 +1,81 @@
+"""
+Unit tests for the MCP server compact embedding vectors
+
+Tests the float32 representation used from the Ollama response to the
+Qdrant request: packing, normalization, read-only sharing, compact copies
+of batch rows and the raw byte format of the embedding cache's disk tier.
+
+Component Under Test:
+- fastmcp_server/templates/embedding_vectors.py.j2
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def vectors_module(mcp_template_module):
+    """Load the compact embedding vector helpers"""
+    return mcp_template_module("embedding_vectors")
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestEmbeddingVectors:
+    """Test packing and conversion of embedding vectors"""
+
+    def test_batch_packed_as_float32_matrix(self, vectors_module):
+        """Test a batch response becomes one read-only (n, dim) float32 matrix"""
+        matrix = vectors_module.to_matrix([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+        assert matrix.shape == (2, 3)
+        assert matrix.dtype == np.float32
+        assert not matrix.flags.writeable
+        assert matrix[1].tolist() == [4.0, 5.0, 6.0]
+
+    def test_ragged_batch_rejected(self, vectors_module):
+        """Test vectors of different lengths raise ValueError"""
+        with pytest.raises(ValueError):
+            vectors_module.to_matrix([[1.0, 2.0], [3.0]])
+        with pytest.raises(ValueError):
+            vectors_module.to_vector([[1.0, 2.0]])
+
+    def test_normalization(self, vectors_module):
+        """Test normalized vectors have unit length and zero vectors stay zero"""
+        matrix = vectors_module.to_matrix([[3.0, 4.0], [0.0, 0.0]], normalize=True)
+        vector = vectors_module.to_vector([0.0, 2.0], normalize=True)
+
+        assert matrix.tolist() == [[pytest.approx(0.6), pytest.approx(0.8)], [0.0, 0.0]]
+        assert vector.tolist() == [0.0, 1.0]
+
+    def test_compact_copies_only_views(self, vectors_module):
+        """Test compact() detaches batch rows and keeps owning vectors as they are"""
+        matrix = vectors_module.to_matrix([[1.0, 2.0], [3.0, 4.0]])
+        vector = vectors_module.to_vector([5.0, 6.0])
+
+        row = vectors_module.compact(matrix[0])
+
+        assert row.base is None and row.tolist() == [1.0, 2.0]
+        assert vectors_module.compact(vector) is vector
+
+    def test_bytes_round_trip(self, vectors_module):
+        """Test the disk format is 4 bytes per dimension and round-trips exactly"""
+        vector = vectors_module.to_vector([0.5, -1.25, 3.0])
+
+        data = vectors_module.to_bytes(vector)
+
+        assert len(data) == 12
+        assert vectors_module.from_bytes(data).tolist() == [0.5, -1.25, 3.0]
+
+    def test_smaller_than_float_list(self, vectors_module):
+        """Test a 1024-dim vector takes a fraction of the memory of a list of floats"""
+        values = [float(i) / 1024 for i in range(1024)]
+        list_bytes = sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+
+        vector = vectors_module.to_vector(values)
+
+        assert vector.nbytes == 4096
+        assert sys.getsizeof(vector) * 6 < list_bytes
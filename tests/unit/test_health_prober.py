@@ -0,0 +1,112 @@
+"""
+Unit tests for the MCP server background health prober
+
+Tests the HealthProber used by health_check: snapshot serving, latency
+history, forced probes, error handling and the background loop.
+
+Component Under Test:
+- fastmcp_server/templates/enhanced_health_check.py.j2
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def health_module(mcp_template_module):
+    """Load the enhanced health check template module"""
+    return mcp_template_module("enhanced_health_check")
+
+
+class FakeCheck:
+    """comprehensive_health_check stand-in returning scripted latencies"""
+
+    def __init__(self, latencies):
+        self.latencies = list(latencies)
+        self.calls = 0
+
+    async def __call__(self):
+        latency = self.latencies[min(self.calls, len(self.latencies) - 1)]
+        self.calls += 1
+        qdrant = {"status": "operational", "response_time_ms": latency} if latency is not None else {"status": "timeout"}
+        return {
+            "overall_status": "healthy" if latency is not None else "degraded",
+            "dependencies": {
+                "qdrant": qdrant,
+                "orchestrator": {"status": "operational", "response_time_ms": 2.0},
+                "ollama": {"status": "operational", "response_time_ms": 3.0}
+            }
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestHealthProber:
+    """Test cached dependency health snapshots"""
+
+    async def test_snapshot_empty_before_first_probe(self, health_module):
+        """Test no snapshot is served before anything was probed"""
+        prober = health_module.HealthProber(check=FakeCheck([1.0]))
+
+        assert prober.snapshot() == {}
+
+    async def test_snapshot_served_without_probing(self, health_module):
+        """Test snapshot() returns the last probe result without calling the check"""
+        check = FakeCheck([1.0])
+        prober = health_module.HealthProber(check=check)
+        await prober.probe()
+
+        snapshot = prober.snapshot()
+        prober.snapshot()
+
+        assert check.calls == 1
+        assert snapshot["overall_status"] == "healthy"
+        assert snapshot["dependencies"]["qdrant"]["response_time_ms"] == 1.0
+        assert "snapshot_age_seconds" in snapshot
+
+    async def test_latency_history(self, health_module):
+        """Test per-dependency latency history is bounded and summarized"""
+        prober = health_module.HealthProber(check=FakeCheck([4.0, None, 2.0, 6.0]), history_size=3)
+        for _ in range(4):
+            await prober.probe()
+
+        qdrant = prober.snapshot()["latency_ms"]["qdrant"]
+        assert qdrant["history"] == [None, 2.0, 6.0]
+        assert qdrant["last"] == 6.0
+        assert qdrant["avg"] == 4.0
+        assert qdrant["max"] == 6.0
+        assert qdrant["failed_probes"] == 1
+
+    async def test_snapshot_is_a_copy(self, health_module):
+        """Test callers adding keys do not modify the stored snapshot"""
+        prober = health_module.HealthProber(check=FakeCheck([1.0]))
+        await prober.probe()
+
+        prober.snapshot()["circuit_breakers"] = {}
+
+        assert "circuit_breakers" not in prober.snapshot()
+
+    async def test_failed_check_recorded(self, health_module):
+        """Test an exception from the check becomes an unknown status snapshot"""
+        async def broken():
+            raise RuntimeError("boom")
+
+        prober = health_module.HealthProber(check=broken)
+        snapshot = await prober.probe()
+
+        assert snapshot["overall_status"] == "unknown"
+        assert prober.stats()["probe_errors"] == 1
+
+    async def test_background_loop_refreshes_snapshot(self, health_module):
+        """Test start() probes once and keeps probing every interval until closed"""
+        check = FakeCheck([1.0])
+        prober = health_module.HealthProber(check=check, interval=0.01)
+
+        await prober.start()
+        assert check.calls == 1
+        await asyncio.sleep(0.05)
+        await prober.close()
+
+        assert check.calls > 2
+        assert prober.stats()["running"] is False
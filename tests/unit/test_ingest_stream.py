@@ -0,0 +1,146 @@
+"""
+Unit tests for the MCP server streaming ingestion client
+
+Tests the IngestStream used by crawl_web to send pages to the orchestrator
+in incremental batches under one job ID: batching, job ID propagation,
+the final batch, and failure handling.
+
+Component Under Test:
+- fastmcp_server/templates/ingest_stream.py.j2
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def stream_module(mcp_template_module):
+    """Load the streaming ingestion template module"""
+    return mcp_template_module("ingest_stream")
+
+
+class FakeOrchestrator:
+    """Records ingest payloads and hands out one job ID"""
+
+    def __init__(self, fail_on_call=None):
+        self.payloads = []
+        self.fail_on_call = fail_on_call
+
+    async def __call__(self, payload):
+        await asyncio.sleep(0)
+        self.payloads.append(payload)
+        if self.fail_on_call == len(self.payloads):
+            raise RuntimeError("orchestrator down")
+        return {"status": "accepted", "job_id": "job-1"}
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestIngestStreamBatching:
+    """Test batching under one job ID"""
+
+    async def test_batches_share_job_id(self, stream_module):
+        """Test first batch creates the job and later batches reuse it"""
+        orchestrator = FakeOrchestrator()
+        stream = stream_module.IngestStream(orchestrator, source_type="web_crawl", batch_size=2)
+
+        for i in range(5):
+            await stream.add(f"page {i}", source_uri=f"https://example.com/{i}")
+        job_id = await stream.finish()
+
+        assert job_id == "job-1"
+        assert [len(p["chunks"]) for p in orchestrator.payloads] == [2, 2, 1]
+        assert "job_id" not in orchestrator.payloads[0]
+        assert all(p["job_id"] == "job-1" for p in orchestrator.payloads[1:])
+        assert [p["final"] for p in orchestrator.payloads] == [False, False, True]
+        assert stream.chunks_sent == 5
+
+    async def test_empty_final_batch_closes_open_job(self, stream_module):
+        """Test an exact multiple of batch_size still sends a closing batch"""
+        orchestrator = FakeOrchestrator()
+        stream = stream_module.IngestStream(orchestrator, source_type="web_crawl", batch_size=2)
+
+        await stream.add("a")
+        await stream.add("b")
+        await stream.finish()
+
+        assert orchestrator.payloads[-1] == {
+            "chunks": [],
+            "source_type": "web_crawl",
+            "metadata": {},
+            "final": True,
+            "job_id": "job-1"
+        }
+
+    async def test_no_chunks_no_job(self, stream_module):
+        """Test nothing is sent when no chunk was added"""
+        orchestrator = FakeOrchestrator()
+        stream = stream_module.IngestStream(orchestrator, source_type="web_crawl")
+
+        assert await stream.finish() is None
+        assert orchestrator.payloads == []
+
+    async def test_concurrent_adds_create_one_job(self, stream_module):
+        """Test concurrent producers never send two job-creating batches"""
+        orchestrator = FakeOrchestrator()
+        stream = stream_module.IngestStream(orchestrator, source_type="web_crawl", batch_size=1)
+
+        await asyncio.gather(*(stream.add(f"page {i}") for i in range(6)))
+        await stream.finish()
+
+        assert sum("job_id" not in p for p in orchestrator.payloads) == 1
+        assert sum(len(p["chunks"]) for p in orchestrator.payloads) == 6
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestIngestStreamErrors:
+    """Test failure handling"""
+
+    async def test_failed_flush_stops_stream(self, stream_module):
+        """Test chunks after a failed batch are dropped and finish() aborts the job, then raises"""
+        orchestrator = FakeOrchestrator(fail_on_call=2)
+        stream = stream_module.IngestStream(orchestrator, source_type="web_crawl", batch_size=1)
+
+        await stream.add("a")
+        await stream.add("b")
+        await stream.add("c")
+
+        assert stream.failed is True
+        with pytest.raises(RuntimeError):
+            await stream.finish()
+        assert len(orchestrator.payloads) == 3
+        assert stream.job_id == "job-1"
+        assert orchestrator.payloads[-1] == {
+            "chunks": [],
+            "source_type": "web_crawl",
+            "metadata": {},
+            "job_id": "job-1",
+            "final": True,
+            "abort_reason": "orchestrator down"
+        }
+
+    async def test_no_abort_without_job(self, stream_module):
+        """Test a failed first batch sends nothing more (no job was created)"""
+        orchestrator = FakeOrchestrator(fail_on_call=1)
+        stream = stream_module.IngestStream(orchestrator, source_type="web_crawl", batch_size=1)
+
+        await stream.add("a")
+
+        with pytest.raises(RuntimeError):
+            await stream.finish()
+        assert len(orchestrator.payloads) == 1
+
+    async def test_abort_is_best_effort(self, stream_module):
+        """Test a failing abort request is swallowed and the flush error still raised"""
+        orchestrator = FakeOrchestrator(fail_on_call=2)
+        stream = stream_module.IngestStream(orchestrator, source_type="web_crawl", batch_size=1)
+        await stream.add("a")
+        await stream.add("b")
+
+        orchestrator.fail_on_call = 3
+        with pytest.raises(RuntimeError, match="orchestrator down"):
+            await stream.finish()
+        assert orchestrator.payloads[-1]["abort_reason"] == "orchestrator down"
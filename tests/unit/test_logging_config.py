@@ -0,0 +1,141 @@
+"""
+Unit tests for the MCP server low-overhead logging helpers
+
+Tests the structlog processors and handler used on the hot path: event
+sampling, per-second rate limiting, lazy fields, field truncation and the
+non-blocking queue handler.
+
+Component Under Test:
+- fastmcp_server/templates/logging_config.py.j2
+"""
+
+import logging
+import queue
+
+import pytest
+import structlog
+
+
+@pytest.fixture
+def logging_module(mcp_template_module):
+    """Load the logging configuration template module"""
+    return mcp_template_module("logging_config")
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def emit(processor, event, method_name="info", **fields):
+    """Run one event through a processor, returning None if it was dropped"""
+    try:
+        return processor(None, method_name, {"event": event, **fields})
+    except structlog.DropEvent:
+        return None
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestEventSampler:
+    """Test sampling and rate limiting of high-frequency events"""
+
+    def test_sampling_keeps_one_in_n(self, logging_module):
+        """Test a 0.25 sample rate keeps every fourth event"""
+        sampler = logging_module.EventSampler(sample_rates={"generate_embedding_start": 0.25})
+
+        kept = [emit(sampler, "generate_embedding_start") for _ in range(8)]
+
+        assert [event is not None for event in kept] == [True, False, False, False] * 2
+        assert kept[0]["sample_rate"] == 0.25
+        assert sampler.stats()["sampled_out"] == 6
+        assert emit(sampler, "qdrant_find_start") is not None
+
+    def test_rate_limit_reports_suppressed_count(self, logging_module):
+        """Test events over the per-second limit are dropped and reported in the next window"""
+        clock = FakeClock()
+        sampler = logging_module.EventSampler(rate_limit_per_second=2, clock=clock)
+
+        kept = [emit(sampler, "orchestrator_api_success") for _ in range(5)]
+        assert sum(event is not None for event in kept) == 2
+
+        clock.now = 1.5
+        event = emit(sampler, "orchestrator_api_success")
+
+        assert event["suppressed"] == 3
+        assert sampler.stats()["rate_limited"] == 3
+
+    def test_warnings_and_errors_never_dropped(self, logging_module):
+        """Test sampling and rate limits only apply to info/debug events"""
+        sampler = logging_module.EventSampler(
+            sample_rates={"circuit_breaker_open": 0.01},
+            rate_limit_per_second=1
+        )
+
+        kept = [emit(sampler, "circuit_breaker_open", method_name="error") for _ in range(10)]
+
+        assert all(event is not None for event in kept)
+
+    def test_parse_sample_rates(self, logging_module):
+        """Test the shield.env "event:rate,..." format"""
+        assert logging_module.parse_sample_rates("a:0.1, b:0.5,") == {"a": 0.1, "b": 0.5}
+        assert logging_module.parse_sample_rates("") == {}
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestLoggingProcessors:
+    """Test lazy fields, truncation and the queue handler"""
+
+    def test_lazy_fields_resolved_only_when_emitted(self, logging_module):
+        """Test lazy values are computed for emitted events and skipped for dropped ones"""
+        calls = []
+
+        def expensive():
+            calls.append(1)
+            return 42
+
+        sampler = logging_module.EventSampler(sample_rates={"qdrant_find_success": 0.5})
+        events = []
+        for _ in range(2):
+            event = emit(sampler, "qdrant_find_success", top_score=logging_module.lazy(expensive))
+            if event is not None:
+                events.append(logging_module.resolve_lazy_fields(None, "info", event))
+
+        assert events[0]["top_score"] == 42
+        assert len(calls) == 1
+
+    def test_lazy_field_error_does_not_raise(self, logging_module):
+        """Test a failing lazy field is logged as an error string"""
+        event = logging_module.resolve_lazy_fields(
+            None, "info", {"event": "x", "value": logging_module.lazy(lambda: 1 / 0)}
+        )
+
+        assert event["value"].startswith("<lazy field error")
+
+    def test_truncate_long_fields(self, logging_module):
+        """Test long string fields are shortened and the event name is kept"""
+        processor = logging_module.truncate_long_fields(5)
+
+        event = processor(None, "info", {"event": "lightrag_query_start", "query": "abcdefghij", "mode": "naive"})
+
+        assert event == {"event": "lightrag_query_start", "query": "abcde...(+5 chars)", "mode": "naive"}
+
+    def test_queue_handler_drops_when_full(self, logging_module):
+        """Test a full queue drops records instead of blocking the caller"""
+        handler = logging_module.NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        record = logging.LogRecord("shield-mcp", logging.INFO, __file__, 1, {"event": "x"}, None, None)
+
+        handler.emit(record)
+        handler.emit(record)
+
+        assert handler.dropped == 1
+        # Records are queued unformatted; the listener's handler renders them
+        assert handler.queue.get_nowait().msg == {"event": "x"}
@@ -0,0 +1,62 @@
+"""
+Unit tests guarding the MCP server's deferred imports
+
+crawl4ai and docling are heavy and only needed by crawl_web / the Docling
+worker processes. These tests fail if the server template imports them at
+module level again (see tests/scripts/benchmark_startup.py for the timing
+and RSS benchmark on a deployed server).
+
+Component Under Test:
+- fastmcp_server/templates/shield_mcp_server.py.j2
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent / "roles" / "fastmcp_server" / "templates"
+DEFERRED_MODULES = ("crawl4ai", "docling")
+
+
+def module_level_imports(template: str):
+    """Top-level module names imported outside of functions in a template"""
+    tree = ast.parse((TEMPLATES_DIR / template).read_text())
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestDeferredImports:
+    """Test heavy stacks stay out of the import path of the server process"""
+
+    @pytest.mark.parametrize("template", [
+        "shield_mcp_server.py.j2",
+        "doc_converter_pool.py.j2",
+        "crawl_frontier.py.j2",
+        "conversion_cache.py.j2",
+    ])
+    def test_no_module_level_heavy_imports(self, template):
+        """Test the server and the helpers it imports do not import crawl4ai or docling eagerly"""
+        assert module_level_imports(template).isdisjoint(DEFERRED_MODULES)
+
+    def test_crawl4ai_imported_inside_crawl_web(self):
+        """Test crawl_web still imports the crawler it uses"""
+        tree = ast.parse((TEMPLATES_DIR / "shield_mcp_server.py.j2").read_text())
+        crawl_web = next(
+            node for node in tree.body
+            if isinstance(node, ast.AsyncFunctionDef) and node.name == "crawl_web"
+        )
+
+        imported = {
+            node.module for node in ast.walk(crawl_web)
+            if isinstance(node, ast.ImportFrom)
+        }
+        assert "crawl4ai" in imported
@@ -5,10 +5,11 @@ Tests the actual business logic of MCP tools with mocked external dependencies.
 This addresses Issue #53 - testing actual tool implementations, not just models.
 
 Tools tested:
-- crawl_web: Web crawling logic
-- ingest_doc: Document ingestion logic
+- crawl_web: Web crawling logic (TestCrawlWebTool: rendered server module)
+- ingest_doc: Document ingestion logic (TestIngestDocTool: rendered server module)
 - qdrant_find: Vector search logic
 - qdrant_store: Vector storage logic
+- qdrant_store_batch: Bulk ingestion (rendered server module, see mcp_server_module)
 - lightrag_query: LightRAG query logic
 - get_job_status: Job status retrieval logic
 - health_check: Health check logic
@@ -16,6 +17,10 @@ Tools tested:
 Phase 2 Sprint 2.2: Automated Testing (TASK-032)
 """
 
+import asyncio
+import sys
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any, List
@@ -101,6 +106,263 @@ class TestCrawlWebImplementation:
         assert request_default.max_pages > 0
 
 
+class FakeCrawler:
+    """crawl4ai.AsyncWebCrawler double serving pages from a dict (url -> page spec)"""
+    
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+    
+    def __call__(self, **kwargs):
+        return self
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def arun(self, url, **kwargs):
+        self.fetched.append(url)
+        page = self.pages.get(url, {"status": 404})
+        status = page.get("status", 200)
+        return SimpleNamespace(
+            success=status < 400,
+            error_message=f"HTTP {status}",
+            status_code=status,
+            markdown=page.get("markdown", ""),
+            html="",
+            title="",
+            links={"internal": [{"href": link} for link in page.get("links", [])]},
+            response_headers=page.get("headers", {})
+        )
+
+
+@pytest.fixture
+def crawl(mcp_server_module, mcp_tool, monkeypatch):
+    """crawl_web with a fake crawler and orchestrator; set crawl.pages before calling"""
+    pages = {}
+    crawler = FakeCrawler(pages)
+    batches = []
+    
+    async def send_ingest_batch(payload):
+        batches.append(payload)
+        return {"job_id": "job-1", "status": "accepted"}
+    
+    monkeypatch.setitem(sys.modules, "crawl4ai", SimpleNamespace(AsyncWebCrawler=crawler))
+    monkeypatch.setattr(mcp_server_module, "send_ingest_batch", send_ingest_batch)
+    monkeypatch.setattr(mcp_server_module, "page_cache", None)
+    
+    tool = mcp_tool("crawl_web")
+    tool.pages = pages
+    tool.crawler = crawler
+    tool.batches = batches
+    return tool
+
+
+def ingested_urls(batches):
+    return sorted(chunk["source_uri"] for batch in batches for chunk in batch["chunks"])
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestCrawlWebTool:
+    """Test crawl_web against the rendered server module"""
+    
+    async def test_pages_streamed_to_orchestrator(self, crawl):
+        """Test linked pages are crawled and ingested under one job"""
+        crawl.pages.update({
+            "https://docs.example.com/": {"markdown": "# Home", "links": ["/a", "https://other.org/x"]},
+            "https://docs.example.com/a": {"markdown": "# A"},
+        })
+        
+        result = await crawl("https://docs.example.com/")
+        
+        assert (result["status"], result["job_id"], result["pages_crawled"]) == ("accepted", "job-1", 2)
+        assert ingested_urls(crawl.batches) == ["https://docs.example.com/", "https://docs.example.com/a"]
+    
+    async def test_start_url_outside_allowed_domains(self, crawl):
+        """Test a start URL the allowed_domains exclude is rejected before crawling"""
+        result = await crawl("https://docs.example.com/", allowed_domains=["example.org"])
+        
+        assert result["error_type"] == "validation_error"
+        assert crawl.crawler.fetched == []
+    
+    async def test_start_url_server_error_reported(self, crawl):
+        """Test a failing start URL is reported as an error, not as an empty crawl"""
+        crawl.pages["https://docs.example.com/"] = {"status": 500}
+        
+        result = await crawl("https://docs.example.com/")
+        
+        assert result["status"] == "error"
+        assert (result["error_type"], result["status_code"]) == ("http_error", 500)
+        assert crawl.batches == []
+    
+    async def test_failing_linked_page_skipped(self, crawl):
+        """Test a linked page that fails does not fail the crawl"""
+        crawl.pages.update({
+            "https://docs.example.com/": {"markdown": "# Home", "links": ["/broken", "/a"]},
+            "https://docs.example.com/a": {"markdown": "# A"},
+            "https://docs.example.com/broken": {"status": 500},
+        })
+        
+        result = await crawl("https://docs.example.com/")
+        
+        assert (result["status"], result["pages_crawled"]) == ("accepted", 2)
+
+
+@pytest.fixture
+def cached_crawl(crawl, orchestrator, mcp_server_module, tmp_path, monkeypatch):
+    """crawl with a page cache; pages answer conditional GETs with 304 when their ETag matches"""
+    revalidations = []
+    
+    def handler(request):
+        revalidations.append(str(request.url))
+        etag = crawl.pages.get(str(request.url), {}).get("headers", {}).get("ETag")
+        if etag is not None and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": etag or ""})
+    
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    cache = mcp_server_module.PageCache(str(tmp_path / "pages"))
+    monkeypatch.setattr(mcp_server_module, "page_cache", cache)
+    monkeypatch.setattr(mcp_server_module, "get_crawl_client", lambda: client)
+    
+    crawl.cache = cache
+    crawl.jobs = orchestrator
+    crawl.revalidations = revalidations
+    return crawl
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestCrawlWebPageCache:
+    """Test recrawls skip pages only once the job that ingested them completed"""
+    
+    PAGES = {
+        "https://docs.example.com/": {"markdown": "# Home", "links": ["/a"], "headers": {"ETag": '"h1"'}},
+        "https://docs.example.com/a": {"markdown": "# A"},
+    }
+    
+    async def test_completed_job_pages_skipped(self, cached_crawl):
+        """Test a recrawl after a completed job revalidates / hashes pages and ingests nothing"""
+        cached_crawl.pages.update(self.PAGES)
+        assert (await cached_crawl("https://docs.example.com/"))["status"] == "accepted"
+        cached_crawl.jobs.routes["/jobs/job-1"] = (200, {"job_id": "job-1", "status": "completed"})
+        cached_crawl.batches.clear()
+        cached_crawl.crawler.fetched.clear()
+        
+        result = await cached_crawl("https://docs.example.com/")
+        
+        assert (result["status"], result["pages_unchanged"]) == ("success", 2)
+        assert cached_crawl.batches == []
+        # 304 for the page with an ETag, rendered and hashed for the one without
+        assert cached_crawl.crawler.fetched == ["https://docs.example.com/a"]
+        assert [r.url.path for r in cached_crawl.jobs.requests] == ["/jobs/job-1"]
+        
+        # Confirmation is written back: a third crawl does not ask the orchestrator again
+        await cached_crawl("https://docs.example.com/")
+        assert len(cached_crawl.jobs.requests) == 1
+    
+    @pytest.mark.parametrize("job", [(200, {"status": "failed"}), (200, {"status": "processing"}), (404, {})])
+    async def test_unfinished_job_pages_ingested_again(self, cached_crawl, job):
+        """Test pages whose job failed, is still running or expired are crawled and ingested again"""
+        cached_crawl.pages.update(self.PAGES)
+        await cached_crawl("https://docs.example.com/")
+        cached_crawl.jobs.routes["/jobs/job-1"] = job
+        cached_crawl.batches.clear()
+        
+        result = await cached_crawl("https://docs.example.com/")
+        
+        assert (result["status"], result["pages_unchanged"]) == ("accepted", 0)
+        assert ingested_urls(cached_crawl.batches) == ["https://docs.example.com/", "https://docs.example.com/a"]
+        # Stale entries are not revalidated, and the job is looked up once per crawl
+        assert cached_crawl.revalidations == []
+        assert len(cached_crawl.jobs.requests) == 1
+    
+    async def test_failed_ingestion_not_cached(self, cached_crawl, mcp_server_module, monkeypatch):
+        """Test pages of a crawl whose ingestion was rejected leave no cache entries"""
+        cached_crawl.pages.update(self.PAGES)
+        
+        async def rejecting_batch(payload):
+            raise httpx.HTTPStatusError(
+                "503", request=httpx.Request("POST", "http://orchestrator"), response=httpx.Response(503)
+            )
+        
+        monkeypatch.setattr(mcp_server_module, "send_ingest_batch", rejecting_batch)
+        
+        assert (await cached_crawl("https://docs.example.com/"))["status"] == "error"
+        assert cached_crawl.cache.stats()["entries"] == 0
+
+
+@pytest.fixture
+def ingest(mcp_server_module, mcp_tool, monkeypatch):
+    """ingest_doc with a fake Docling pool and orchestrator; set ingest.markdown before calling"""
+    batches = []
+    
+    async def convert(path, input_format=None):
+        ingest.formats.append(input_format)
+        return {"markdown": ingest.markdown, "page_count": 1, "title": "Doc"}
+    
+    async def send_ingest_batch(payload):
+        batches.append(payload)
+        return {"job_id": "job-1", "status": "accepted"}
+    
+    monkeypatch.setattr(mcp_server_module, "doc_converter_pool", SimpleNamespace(convert=convert))
+    monkeypatch.setattr(mcp_server_module, "conversion_cache", None)
+    monkeypatch.setattr(mcp_server_module, "send_ingest_batch", send_ingest_batch)
+    
+    ingest = mcp_tool("ingest_doc")
+    ingest.markdown = ""
+    ingest.formats = []
+    ingest.batches = batches
+    return ingest
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestIngestDocTool:
+    """Test ingest_doc against the rendered server module"""
+    
+    async def test_chunks_streamed_to_orchestrator(self, ingest, tmp_path):
+        """Test a document with text is accepted under the orchestrator's job ID"""
+        doc = tmp_path / "guide.md"
+        doc.write_text("# Guide\n\nInstall the agent before enrolling the host.\n")
+        ingest.markdown = doc.read_text()
+        
+        result = await ingest(str(doc))
+        
+        assert (result["status"], result["job_id"]) == ("accepted", "job-1")
+        assert result["check_status_endpoint"] == "/jobs/job-1"
+        assert ingest.batches[-1]["final"] is True
+    
+    async def test_text_files_converted_as_markdown(self, ingest, tmp_path):
+        """Test the Docling input format for the extension reaches the conversion pool"""
+        doc = tmp_path / "notes.txt"
+        doc.write_text("Plain notes about enrolling hosts.\n")
+        ingest.markdown = doc.read_text()
+        
+        await ingest(str(doc))
+        
+        assert ingest.formats == ["md"]
+    
+    @pytest.mark.parametrize("markdown", ["# Title\n\n## Sub\n", "<!-- image -->\n", "  \n"])
+    async def test_document_without_chunks_rejected(self, ingest, tmp_path, markdown):
+        """Test a document with no text chunks is an error, not an accepted job without ID"""
+        doc = tmp_path / "empty.md"
+        doc.write_text(markdown)
+        ingest.markdown = markdown
+        
+        result = await ingest(str(doc))
+        
+        assert (result["status"], result["error_type"]) == ("error", "empty_document")
+        assert "job_id" not in result
+        assert ingest.batches == []
+
+
 @pytest.mark.unit
 @pytest.mark.mcp
 @pytest.mark.fast
@@ -284,6 +546,201 @@ class TestQdrantStoreImplementation:
         assert all(len(v) == len(vectors[0]) for v in vectors)
 
 
+class FakeQdrantManager:
+    """Stands in for the server's QdrantManager (client calls recorded on the manager itself)"""
+    
+    def __init__(self, fail_upsert_when=None):
+        self.fail_upsert_when = fail_upsert_when
+        self.upserts = []
+        self.searches = []
+        self.forgotten = []
+        self.search_params = None
+        self.client = self
+    
+    async def ensure_collection(self, collection):
+        return False
+    
+    def forget_collection(self, collection):
+        self.forgotten.append(collection)
+    
+    async def upsert(self, collection_name, points, wait=False):
+        if self.fail_upsert_when and any(self.fail_upsert_when(point.payload["text"]) for point in points):
+            raise RuntimeError("upsert rejected")
+        self.upserts.append(points)
+    
+    async def query_batch_points(self, collection_name, requests):
+        """One hit per request, identified by the request's query vector"""
+        self.searches.append(requests)
+        return [
+            SimpleNamespace(points=[
+                SimpleNamespace(id=f"hit-{request.query[0]:g}", score=request.query[0] / 100, payload={"n": request.query[0]})
+            ])
+            for request in requests
+        ]
+
+
+def fake_vector(text):
+    import numpy as np  # MCP server dependency (mcp_server_module skips without it)
+    return np.full(4, float(len(text)), dtype=np.float32)
+
+
+@pytest.fixture
+def store_batch(mcp_server_module, mcp_tool, monkeypatch):
+    """qdrant_store_batch with fake embeddings and Qdrant (chunks of 2, 2 chunks at a time)"""
+    embedding_calls = []
+    concurrency = {"active": 0, "max": 0}
+    
+    async def generate_embeddings(texts, model=None):
+        embedding_calls.append(list(texts))
+        concurrency["active"] += 1
+        concurrency["max"] = max(concurrency["max"], concurrency["active"])
+        try:
+            await asyncio.sleep(0.01)
+            if any("bad" in text for text in texts):
+                raise RuntimeError("ollama unavailable")
+            return [fake_vector(text) for text in texts]
+        finally:
+            concurrency["active"] -= 1
+    
+    manager = FakeQdrantManager()
+    monkeypatch.setattr(mcp_server_module, "generate_embeddings", generate_embeddings)
+    monkeypatch.setattr(mcp_server_module, "qdrant_manager", manager)
+    monkeypatch.setattr(mcp_server_module.payload_index_manager, "ensure_configured", AsyncMock())
+    monkeypatch.setattr(mcp_server_module, "QDRANT_STORE_BATCH_SIZE", 2)
+    monkeypatch.setattr(mcp_server_module, "QDRANT_STORE_CONCURRENCY", 2)
+    
+    tool = mcp_tool("qdrant_store_batch")
+    tool.manager = manager
+    tool.embedding_calls = embedding_calls
+    tool.concurrency = concurrency
+    return tool
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestQdrantStoreBatchImplementation:
+    """Test qdrant_store_batch against the rendered server module"""
+    
+    async def test_per_item_results(self, store_batch):
+        """Test every text gets a result with its index, point ID and payload metadata"""
+        result = await store_batch(
+            texts=["alpha", "beta", "gamma"],
+            metadata=[{"source": "a"}, None, {"source": "c"}],
+            point_ids=["p-0", None, "p-2"],
+            collection="docs"
+        )
+        
+        assert (result["status"], result["stored"], result["failed"]) == ("success", 3, 0)
+        assert [r["index"] for r in result["results"]] == [0, 1, 2]
+        assert [r["point_id"] for r in result["results"]][::2] == ["p-0", "p-2"]
+        assert result["results"][1]["point_id"]  # generated
+        payloads = {point.id: point.payload for points in store_batch.manager.upserts for point in points}
+        assert payloads["p-0"]["source"] == "a" and payloads["p-2"]["text"] == "gamma"
+        assert [len(points) for points in store_batch.manager.upserts] == [2, 1]
+    
+    async def test_embedding_failure_fails_only_its_chunk(self, store_batch):
+        """Test a failed embedding call marks its own chunk's items and leaves other chunks stored"""
+        result = await store_batch(texts=["ok 1", "ok 2", "bad 3", "ok 4", "ok 5"])
+        
+        statuses = [r["status"] for r in result["results"]]
+        assert statuses == ["success", "success", "error", "error", "success"]
+        assert {r["error_type"] for r in result["results"] if r["status"] == "error"} == {"embedding_error"}
+        assert (result["status"], result["stored"], result["failed"]) == ("success", 3, 2)
+    
+    async def test_upsert_failure_fails_only_its_chunk(self, store_batch):
+        """Test a rejected upsert marks only that chunk's items as failed"""
+        store_batch.manager.fail_upsert_when = lambda text: text == "reject"
+        
+        result = await store_batch(texts=["a", "b", "reject", "c"])
+        
+        assert [r["status"] for r in result["results"]] == ["success", "success", "error", "error"]
+        assert result["results"][2]["error_type"] == "upsert_error"
+        assert result["failed"] == 2
+    
+    async def test_chunk_concurrency_bounded(self, store_batch):
+        """Test no more than QDRANT_STORE_CONCURRENCY chunks are embedded at once"""
+        result = await store_batch(texts=[f"text {i}" for i in range(12)])
+        
+        assert result["stored"] == 12
+        assert len(store_batch.embedding_calls) == 6
+        assert store_batch.concurrency["max"] == 2
+    
+    @pytest.mark.parametrize("field", ["metadata", "point_ids"])
+    async def test_mismatched_lengths_rejected(self, store_batch, field):
+        """Test metadata / point_ids must have one entry per text"""
+        result = await store_batch(texts=["a", "b"], **{field: [None]})
+        
+        assert result["status"] == "error"
+        assert result["error_type"] == "validation_error"
+        assert field in result["error"]
+        assert store_batch.embedding_calls == []
+
+
+@pytest.fixture
+def find(mcp_server_module, mcp_tool, monkeypatch):
+    """qdrant_find with fake embeddings (vector value = query length) and Qdrant"""
+    embedding_calls = []
+    
+    async def generate_embeddings(texts, model=None):
+        embedding_calls.append(list(texts))
+        return [fake_vector(text) for text in texts]
+    
+    async def generate_embedding(text, model=None):
+        embedding_calls.append(text)
+        return fake_vector(text)
+    
+    manager = FakeQdrantManager()
+    monkeypatch.setattr(mcp_server_module, "generate_embeddings", generate_embeddings)
+    monkeypatch.setattr(mcp_server_module, "generate_embedding", generate_embedding)
+    monkeypatch.setattr(mcp_server_module, "qdrant_manager", manager)
+    
+    tool = mcp_tool("qdrant_find")
+    tool.manager = manager
+    tool.embedding_calls = embedding_calls
+    return tool
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestQdrantFindMultiQuery:
+    """Test qdrant_find with one or several queries against the rendered server module"""
+    
+    async def test_results_grouped_in_input_order(self, find):
+        """Test a list is embedded and searched in one call each, results grouped per query"""
+        queries = ["three", "a", "eleven char"]
+        
+        result = await find(query=queries, collection="docs", limit=3)
+        
+        assert result["status"] == "success"
+        assert result["queries"] == queries
+        assert (result["query_count"], result["result_count"]) == (3, 3)
+        assert [group["query"] for group in result["results"]] == queries
+        assert [group["results"][0]["id"] for group in result["results"]] == ["hit-5", "hit-1", "hit-11"]
+        assert find.embedding_calls == [queries]
+        assert len(find.manager.searches) == 1
+        assert [request.limit for request in find.manager.searches[0]] == [3, 3, 3]
+    
+    async def test_single_query_keeps_response_shape(self, find):
+        """Test a plain string returns the flat result list it always did"""
+        result = await find(query="four", collection="docs")
+        
+        assert result["query"] == "four"
+        assert result["result_count"] == 1
+        assert result["results"] == [{"id": "hit-4", "score": 0.04, "payload": {"n": 4.0}}]
+        assert "queries" not in result and "query_count" not in result
+        assert find.embedding_calls == ["four"]
+    
+    @pytest.mark.parametrize("query", [[], ["ok", ""], ""])
+    async def test_empty_queries_rejected(self, find, query):
+        """Test empty lists and empty query strings are validation errors"""
+        result = await find(query=query)
+        
+        assert result["error_type"] == "validation_error"
+        assert find.manager.searches == []
+
+
 @pytest.mark.unit
 @pytest.mark.mcp
 @pytest.mark.fast
@@ -329,6 +786,72 @@ class TestLightRAGQueryImplementation:
             assert request.mode == mode
 
 
+@pytest.fixture
+def orchestrator(mcp_server_module, monkeypatch):
+    """
+    Rendered server talking to a fake orchestrator
+
+    Responses are looked up by path in `routes` (status, JSON body); requests
+    are recorded in `requests`. Breakers start and end closed.
+    """
+    routes = {}
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        status_code, body = routes.get(request.url.path, (404, {"detail": "Not Found"}))
+        return httpx.Response(status_code, json=body)
+    
+    client = httpx.AsyncClient(base_url=mcp_server_module.ORCHESTRATOR_BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(mcp_server_module, "_orchestrator_client", client)
+    monkeypatch.setattr(mcp_server_module, "_corpus_generation", None)
+    for breaker in mcp_server_module.orchestrator_breakers.values():
+        breaker.reset()
+    
+    yield SimpleNamespace(routes=routes, requests=requests, breakers=mcp_server_module.orchestrator_breakers)
+    
+    for breaker in mcp_server_module.orchestrator_breakers.values():
+        breaker.reset()
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestCorpusGeneration:
+    """Test the corpus generation lookup used by the lightrag_query result cache"""
+    
+    async def test_cached_for_ttl(self, mcp_server_module, orchestrator, monkeypatch):
+        """Test a burst of lookups costs one request until the TTL expires"""
+        orchestrator.routes["/lightrag/corpus-generation"] = (200, {"generation": 7})
+        
+        assert await mcp_server_module.get_corpus_generation() == 7
+        assert await mcp_server_module.get_corpus_generation() == 7
+        assert len(orchestrator.requests) == 1
+        
+        monkeypatch.setattr(mcp_server_module, "CORPUS_GENERATION_TTL", 0)
+        orchestrator.routes["/lightrag/corpus-generation"] = (200, {"generation": 8})
+        assert await mcp_server_module.get_corpus_generation() == 8
+    
+    async def test_missing_endpoint_does_not_trip_query_breaker(self, mcp_server_module, orchestrator, monkeypatch):
+        """Test 404s from an orchestrator without the endpoint stay off the query breaker"""
+        monkeypatch.setattr(mcp_server_module, "CORPUS_GENERATION_TTL", 0)
+        
+        for _ in range(10):
+            assert await mcp_server_module.get_corpus_generation() is None
+        
+        assert mcp_server_module.orchestrator_endpoint_class("/lightrag/corpus-generation") == "corpus_generation"
+        assert orchestrator.breakers["corpus_generation"].current_state.value == "open"
+        assert orchestrator.breakers["query"].current_state.value == "closed"
+        assert orchestrator.breakers["query"].fail_counter == 0
+    
+    async def test_failure_cached_too(self, mcp_server_module, orchestrator):
+        """Test a failed lookup is not retried by every query within the TTL"""
+        assert await mcp_server_module.get_corpus_generation() is None
+        assert await mcp_server_module.get_corpus_generation() is None
+        
+        assert len(orchestrator.requests) == 1
+
+
 @pytest.mark.unit
 @pytest.mark.mcp
 @pytest.mark.fast
@@ -375,6 +898,52 @@ class TestGetJobStatusImplementation:
         assert response.status_code == 404
 
 
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestGetJobStatusWaitForChange:
+    """Test get_job_status long-polling against the rendered server module"""
+    
+    async def test_long_poll_uses_wait_endpoint(self, mcp_tool, orchestrator):
+        """Test wait_for_change calls /jobs/{id}/wait and passes on the changed flag"""
+        orchestrator.routes["/jobs/job-1/wait"] = (200, {"status": "processing", "changed": True})
+        
+        result = await mcp_tool("get_job_status")(job_id="job-1", wait_for_change=True, timeout=12)
+        
+        assert (result["job_status"], result["changed"]) == ("processing", True)
+        request = orchestrator.requests[0]
+        assert float(request.url.params["timeout"]) == 12
+        assert request.extensions["timeout"]["read"] == 22.0
+    
+    async def test_wait_capped_by_max_wait(self, mcp_server_module, mcp_tool, orchestrator, monkeypatch):
+        """Test the requested wait never exceeds JOB_STATUS_MAX_WAIT"""
+        monkeypatch.setattr(mcp_server_module, "JOB_STATUS_MAX_WAIT", 60.0)
+        orchestrator.routes["/jobs/job-1/wait"] = (200, {"status": "completed", "changed": False})
+        
+        result = await mcp_tool("get_job_status")(job_id="job-1", wait_for_change=True, timeout=3600)
+        
+        assert result["changed"] is False
+        assert float(orchestrator.requests[0].url.params["timeout"]) == 60
+    
+    async def test_plain_status_has_no_changed_flag(self, mcp_tool, orchestrator):
+        """Test without wait_for_change the plain status endpoint is used"""
+        orchestrator.routes["/jobs/job-1"] = (200, {"status": "queued"})
+        
+        result = await mcp_tool("get_job_status")(job_id="job-1")
+        
+        assert orchestrator.requests[0].url.path == "/jobs/job-1"
+        assert result["job_status"] == "queued"
+        assert "changed" not in result
+    
+    async def test_wait_for_unknown_job(self, mcp_tool, orchestrator):
+        """Test a 404 from the long-poll is reported as not_found on the job_wait breaker"""
+        result = await mcp_tool("get_job_status")(job_id="missing", wait_for_change=True, timeout=1)
+        
+        assert result["error_type"] == "not_found"
+        assert orchestrator.breakers["job_wait"].fail_counter == 1
+        assert orchestrator.breakers["jobs"].fail_counter == 0
+
+
 @pytest.mark.unit
 @pytest.mark.mcp
 @pytest.mark.fast
@@ -421,3 +990,26 @@ class TestHealthCheckImplementation:
         assert data["status"] == "degraded"
         assert data["circuit_breaker"]["state"] == "open"
 
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestWorkerShare:
+    """Test per-host work divided between multi-worker processes"""
+    
+    def test_docling_workers_divided_between_workers(self, mcp_server_module):
+        """Test the shares add up to the per-host total, spread as evenly as possible"""
+        shares = [mcp_server_module.worker_share(5, 3, index) for index in range(3)]
+        
+        assert shares == [2, 2, 1]
+        assert sum(shares) == 5
+    
+    def test_fewer_items_than_workers(self, mcp_server_module):
+        """Test workers beyond the total get a zero share"""
+        assert [mcp_server_module.worker_share(2, 4, index) for index in range(4)] == [1, 1, 0, 0]
+    
+    def test_single_worker_keeps_everything(self, mcp_server_module):
+        """Test single-process mode keeps the whole configured pool"""
+        assert mcp_server_module.worker_share(mcp_server_module.DOCLING_WORKERS, 1, 0) == \
+            mcp_server_module.DOCLING_WORKER_SHARE
@@ -0,0 +1,125 @@
+"""
+Unit tests for the MCP server Prometheus metrics
+
+Tests MCPMetrics served on /metrics: tool instrumentation (latency, call
+and error counters), scrape-time samples from stats() sources, isolation
+of broken sources and the exposition output.
+
+Component Under Test:
+- fastmcp_server/templates/metrics.py.j2
+"""
+
+import inspect
+import pytest
+
+
+@pytest.fixture
+def metrics_module(mcp_template_module):
+    """Load the metrics template module"""
+    return mcp_template_module("metrics")
+
+
+def sample(metrics, name, **labels):
+    """Current value of one sample in the metrics registry"""
+    return metrics.registry.get_sample_value(name, labels)
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestMCPMetrics:
+    """Test Prometheus instrumentation"""
+
+    async def test_instrument_tool_counts_and_times(self, metrics_module):
+        """Test each call is counted and observed in the latency histogram"""
+        metrics = metrics_module.MCPMetrics()
+
+        @metrics.instrument_tool("qdrant_find")
+        async def qdrant_find(query: str, limit: int = 5):
+            return {"status": "success", "query": query, "limit": limit}
+
+        assert await qdrant_find("q", limit=3) == {"status": "success", "query": "q", "limit": 3}
+        await qdrant_find("q")
+
+        assert sample(metrics, "fastmcp_tool_executions_total", tool="qdrant_find") == 2
+        assert sample(metrics, "fastmcp_tool_duration_seconds_count", tool="qdrant_find") == 2
+        assert sample(metrics, "fastmcp_tool_errors_total", tool="qdrant_find", error_type="timeout_error") is None
+
+    async def test_instrument_tool_keeps_signature(self, metrics_module):
+        """Test the wrapper exposes the tool's signature (FastMCP builds the schema from it)"""
+        metrics = metrics_module.MCPMetrics()
+
+        async def get_job_status(job_id: str, wait_for_change: bool = False):
+            """Get job status"""
+            return {"status": "success"}
+
+        wrapped = metrics.instrument_tool("get_job_status")(get_job_status)
+
+        assert inspect.signature(wrapped) == inspect.signature(get_job_status)
+        assert wrapped.__doc__ == "Get job status"
+        assert inspect.iscoroutinefunction(wrapped)
+
+    async def test_error_results_and_exceptions_counted(self, metrics_module):
+        """Test error dicts are counted by error_type and exceptions are re-raised"""
+        metrics = metrics_module.MCPMetrics()
+
+        @metrics.instrument_tool("lightrag_query")
+        async def failing(mode: str):
+            if mode == "raise":
+                raise RuntimeError("boom")
+            return {"status": "error", "error": "down", "error_type": "circuit_breaker_error"}
+
+        await failing("dict")
+        with pytest.raises(RuntimeError):
+            await failing("raise")
+
+        assert sample(metrics, "fastmcp_tool_errors_total", tool="lightrag_query", error_type="circuit_breaker_error") == 1
+        assert sample(metrics, "fastmcp_tool_errors_total", tool="lightrag_query", error_type="exception") == 1
+        assert sample(metrics, "fastmcp_tool_executions_total", tool="lightrag_query") == 2
+
+    def test_sources_collected_at_scrape_time(self, metrics_module):
+        """Test gauges and counters are read from sources on every scrape"""
+        metrics = metrics_module.MCPMetrics()
+        cache_stats = {"hits": 3, "hit_ratio": 0.75}
+
+        def source():
+            labels = {"cache": "embedding"}
+            yield "fastmcp_cache_hits_total", "Cache hits", labels, cache_stats["hits"]
+            yield "fastmcp_cache_hit_ratio", "Cache hit ratio", labels, cache_stats["hit_ratio"]
+
+        metrics.add_source(source)
+
+        assert sample(metrics, "fastmcp_cache_hits_total", cache="embedding") == 3
+        assert sample(metrics, "fastmcp_cache_hit_ratio", cache="embedding") == 0.75
+
+        cache_stats["hits"] = 5
+        assert sample(metrics, "fastmcp_cache_hits_total", cache="embedding") == 5
+
+    def test_broken_source_does_not_break_scrape(self, metrics_module):
+        """Test a failing source is skipped and counted"""
+        metrics = metrics_module.MCPMetrics()
+
+        def broken():
+            raise RuntimeError("stats unavailable")
+
+        def healthy():
+            yield "fastmcp_circuit_breaker_state", "Breaker state", {"breaker": "orchestrator_query"}, 2
+
+        metrics.add_source(broken)
+        metrics.add_source(healthy)
+
+        payload, content_type = metrics.render()
+
+        assert content_type.startswith("text/plain")
+        assert b'fastmcp_circuit_breaker_state{breaker="orchestrator_query"} 2.0' in payload
+        assert metrics.stats() == {"sample_sources": 2, "source_errors": 1}
+
+    def test_instances_use_separate_registries(self, metrics_module):
+        """Test two MCPMetrics do not clash on metric registration"""
+        first = metrics_module.MCPMetrics()
+        second = metrics_module.MCPMetrics()
+
+        first.orchestrator_duration.labels(endpoint_class="query", outcome="success").observe(0.2)
+
+        assert sample(first, "fastmcp_orchestrator_duration_seconds_count", endpoint_class="query", outcome="success") == 1
+        assert sample(second, "fastmcp_orchestrator_duration_seconds_count", endpoint_class="query", outcome="success") is None
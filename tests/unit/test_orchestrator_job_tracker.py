@@ -25,8 +25,15 @@ Test Coverage:
 - Timestamp management
 - Error handling (PostgreSQL failures)
 - TTL extension on updates
+- Streaming jobs (add_chunks, close_stream, completion claim, abandoned streams)
 """
 
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
@@ -70,6 +77,53 @@ class MockRedisClient:
         """Mock EXPIRE"""
         self.ttls[key] = ttl
 
+    async def hdel(self, key: str, *fields):
+        """Mock HDEL"""
+        removed = [f for f in fields if self.data.get(key, {}).pop(f, None) is not None]
+        return len(removed)
+
+    async def hsetnx(self, key: str, field: str, value):
+        """Mock HSETNX (yields first, so concurrent callers interleave)"""
+        await asyncio.sleep(0)
+        fields = self.data.setdefault(key, {})
+        if field in fields:
+            return 0
+        fields[field] = str(value)
+        return 1
+
+    async def incr(self, key: str):
+        """Mock INCR"""
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def get(self, key: str):
+        """Mock GET"""
+        value = self.data.get(key)
+        return None if value is None else str(value).encode()
+
+    async def zadd(self, key: str, mapping: dict, xx: bool = False):
+        """Mock ZADD (XX: only update existing members)"""
+        members = self.data.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if xx and member not in members:
+                continue
+            added += member not in members
+            members[member] = score
+        return added
+
+    async def zrem(self, key: str, *members):
+        """Mock ZREM"""
+        return sum(self.data.get(key, {}).pop(m, None) is not None for m in members)
+
+    async def zrangebyscore(self, key: str, min_score, max_score):
+        """Mock ZRANGEBYSCORE"""
+        low = float(min_score)
+        return [
+            m.encode() for m, score in sorted(self.data.get(key, {}).items(), key=lambda i: i[1])
+            if low <= score <= max_score
+        ]
+
 
 class MockDatabaseSession:
     """Mock database session"""
@@ -358,3 +412,116 @@ class TestJobProgressTracking:
 
         assert "error" in progress
         assert progress["error"] == "Job not found"
+
+
+@pytest.fixture
+def job_tracker_module(monkeypatch):
+    """
+    Render the real job_tracker template against an in-memory Redis.
+
+    PostgreSQL is unavailable (get_sessionmaker raises), which the tracker
+    treats as a Redis-only deployment.
+    """
+    jinja2 = pytest.importorskip("jinja2")
+    yaml = pytest.importorskip("yaml")
+    pytest.importorskip("sqlalchemy")
+
+    role_dir = Path(__file__).parent.parent.parent / "roles" / "orchestrator_workers"
+    defaults = yaml.safe_load((role_dir / "defaults" / "main.yml").read_text())
+    source = jinja2.Template(
+        (role_dir / "templates" / "services" / "job_tracker.py.j2").read_text(),
+        undefined=jinja2.StrictUndefined
+    ).render(job_status_ttl=defaults["job_status_ttl"])
+
+    redis_client = MockRedisClient()
+    database_manager = MagicMock()
+    database_manager.get_sessionmaker.side_effect = RuntimeError("PostgreSQL unavailable")
+    monkeypatch.setitem(sys.modules, "services", SimpleNamespace())
+    monkeypatch.setitem(
+        sys.modules, "services.redis_streams",
+        SimpleNamespace(redis_streams=SimpleNamespace(client=redis_client))
+    )
+    monkeypatch.setitem(sys.modules, "database", SimpleNamespace())
+    monkeypatch.setitem(sys.modules, "database.models", SimpleNamespace(JobStatus=MagicMock()))
+    monkeypatch.setitem(
+        sys.modules, "database.connection", SimpleNamespace(DatabaseManager=database_manager)
+    )
+
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader("job_tracker", loader=None))
+    exec(compile(source, "job_tracker.py", "exec"), module.__dict__)
+    module.redis = redis_client
+    return module
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestStreamingJobs:
+    """Test the rendered tracker's streaming job lifecycle"""
+
+    async def test_add_chunks_extends_total(self, job_tracker_module):
+        """Test appended batches grow chunks_total and keep the job streaming"""
+        tracker = job_tracker_module.JobTracker()
+        job_id = await tracker.create_job("lightrag_ingestion", chunks_total=3, streaming=True)
+
+        assert await tracker.add_chunks(job_id, 2) == 5
+        assert await tracker.add_chunks(job_id, 4) == 9
+
+        progress = await tracker.get_progress(job_id)
+        assert (progress["chunks_total"], progress["streaming"]) == (9, True)
+        assert job_tracker_module.redis.ttls[f"job:{job_id}"] == tracker.job_status_ttl
+
+    async def test_close_stream(self, job_tracker_module):
+        """Test closing a stream clears the streaming flag and the idle tracking"""
+        tracker = job_tracker_module.JobTracker()
+        job_id = await tracker.create_job("lightrag_ingestion", chunks_total=1, streaming=True)
+
+        await tracker.close_stream(job_id)
+
+        assert (await tracker.get_progress(job_id))["streaming"] is False
+        assert job_tracker_module.redis.data[job_tracker_module.STREAMING_JOBS_KEY] == {}
+
+    async def test_claim_completion_once(self, job_tracker_module):
+        """Test only the first claim wins"""
+        tracker = job_tracker_module.JobTracker()
+        job_id = await tracker.create_job("lightrag_ingestion", chunks_total=1)
+
+        assert await tracker.claim_completion(job_id) is True
+        assert await tracker.claim_completion(job_id) is False
+
+    async def test_concurrent_claims_one_winner(self, job_tracker_module):
+        """Test the last worker and the closing request racing to complete a job"""
+        tracker = job_tracker_module.JobTracker()
+        job_id = await tracker.create_job("lightrag_ingestion", chunks_total=1)
+
+        claims = await asyncio.gather(tracker.claim_completion(job_id), tracker.claim_completion(job_id))
+
+        assert sorted(claims) == [False, True]
+
+    async def test_fail_stream(self, job_tracker_module):
+        """Test an aborted stream is closed and failed, and a finished job is left alone"""
+        tracker = job_tracker_module.JobTracker()
+        job_id = await tracker.create_job("lightrag_ingestion", chunks_total=2, streaming=True)
+
+        assert await tracker.fail_stream(job_id, "crawl failed") is True
+        assert await tracker.fail_stream(job_id, "crawl failed") is False
+
+        progress = await tracker.get_progress(job_id)
+        assert (progress["status"], progress["streaming"]) == ("failed", False)
+        assert progress["error_message"] == "crawl failed"
+
+    async def test_fail_stale_streams(self, job_tracker_module):
+        """Test only streams idle past the timeout are failed"""
+        tracker = job_tracker_module.JobTracker()
+        idle = await tracker.create_job("lightrag_ingestion", chunks_total=1, streaming=True)
+        active = await tracker.create_job("lightrag_ingestion", chunks_total=1, streaming=True)
+        closed = await tracker.create_job("lightrag_ingestion", chunks_total=1, streaming=True)
+        await tracker.close_stream(closed)
+
+        streams = job_tracker_module.redis.data[job_tracker_module.STREAMING_JOBS_KEY]
+        streams[idle] -= 3600
+        await tracker.add_chunks(closed, 1)
+
+        assert await tracker.fail_stale_streams(900) == [idle]
+        assert (await tracker.get_progress(idle))["status"] == "failed"
+        assert (await tracker.get_progress(active))["status"] == "queued"
+        assert list(streams) == [active]
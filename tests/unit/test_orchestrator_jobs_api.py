@@ -10,6 +10,7 @@ Component Under Test:
 Jobs API Features (deployed on orchestrator at hx-orchestrator-server:8000):
 - Job status retrieval (GET /jobs/{job_id})
 - Job listing with filters (GET /jobs?status=...)
+- Long-poll for job changes (GET /jobs/{job_id}/wait)
 - Progress tracking and percentage calculation
 - Pydantic response model validation
 - Error handling (404, 500, 503)
@@ -21,8 +22,16 @@ Test Coverage:
 - Response model validation (JobStatusResponse, JobListResponse)
 - Edge cases (empty results, invalid job_id)
 - Error handling (job not found, internal errors)
+- Long-poll wake-up by job events, timeouts and event bus client slots
 """
 
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
@@ -407,3 +416,133 @@ class TestJobsAPIErrorHandling:
 
         assert len(jobs) == 0
         assert isinstance(jobs, list)
+
+
+def _render_module(name, template, variables):
+    """Render an orchestrator_workers template and execute it as a module"""
+    jinja2 = pytest.importorskip("jinja2")
+    source = jinja2.Template(template.read_text(), undefined=jinja2.StrictUndefined).render(**variables)
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader=None))
+    exec(compile(source, f"{name}.py", "exec"), module.__dict__)
+    return module
+
+
+@pytest.fixture
+def load_jobs_api(monkeypatch):
+    """
+    Render the real jobs API and event bus templates around a MockJobTracker
+
+    Usage:
+        api = load_jobs_api(job_wait_recheck_interval=0.05)
+        await api.jobs.wait_for_job_change("job-1", timeout=1)
+    """
+    pytest.importorskip("fastapi")
+    yaml = pytest.importorskip("yaml")
+    role_dir = Path(__file__).parent.parent.parent / "roles" / "orchestrator_workers"
+    defaults = yaml.safe_load((role_dir / "defaults" / "main.yml").read_text())
+
+    def _load(**overrides):
+        variables = {**defaults, **overrides}
+        tracker = MockJobTracker()
+        event_bus_module = _render_module(
+            "event_bus", role_dir / "templates" / "services" / "event_bus.py.j2", variables
+        )
+        monkeypatch.setitem(sys.modules, "services", SimpleNamespace())
+        monkeypatch.setitem(sys.modules, "services.job_tracker", SimpleNamespace(job_tracker=tracker))
+        monkeypatch.setitem(sys.modules, "services.event_bus", event_bus_module)
+        jobs = _render_module("jobs", role_dir / "templates" / "api" / "jobs.py.j2", variables)
+        return SimpleNamespace(jobs=jobs, tracker=tracker, event_bus=event_bus_module.event_bus)
+
+    return _load
+
+
+def _job(status="processing", chunks_processed=1):
+    return {
+        "job_id": "job-1",
+        "job_type": "lightrag_ingestion",
+        "status": status,
+        "chunks_total": 4,
+        "chunks_processed": chunks_processed,
+        "percent_complete": chunks_processed * 25.0,
+        "created_at": "2025-01-01T00:00:00"
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestWaitForJobChange:
+    """Test GET /jobs/{job_id}/wait against the rendered jobs API"""
+
+    async def test_woken_by_job_event(self, load_jobs_api):
+        """Test a long-poll returns as soon as an event for its job is emitted"""
+        api = load_jobs_api(job_wait_recheck_interval=30)
+        api.tracker.add_job(_job())
+
+        wait = asyncio.create_task(api.jobs.wait_for_job_change("job-1", timeout=30))
+        await asyncio.sleep(0.01)
+        api.tracker.add_job(_job(chunks_processed=2))
+        await api.event_bus.emit_event("ingestion.progress", job_id="job-1")
+
+        response = await asyncio.wait_for(wait, timeout=2)
+        assert (response.changed, response.chunks_processed) == (True, 2)
+        assert api.event_bus.job_waiters == {}
+
+    async def test_other_jobs_do_not_wake(self, load_jobs_api):
+        """Test events of other jobs are not delivered to the waiter"""
+        api = load_jobs_api(job_wait_recheck_interval=30)
+        api.tracker.add_job(_job())
+
+        wait = asyncio.create_task(api.jobs.wait_for_job_change("job-1", timeout=0.3))
+        await asyncio.sleep(0.01)
+        waiter = next(iter(api.event_bus.job_waiters["job-1"]))
+        await api.event_bus.emit_event("ingestion.progress", job_id="job-2")
+
+        assert waiter.is_set() is False
+        assert (await wait).changed is False
+
+    async def test_waiters_take_no_client_slot(self, load_jobs_api):
+        """Test long-polls work while the event bus is full and are not counted as subscribers"""
+        api = load_jobs_api(job_wait_recheck_interval=30, event_bus_max_clients=0)
+        api.tracker.add_job(_job())
+
+        waits = [asyncio.create_task(api.jobs.wait_for_job_change("job-1", timeout=30)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        stats = api.event_bus.get_stats()
+        assert (stats["active_subscribers"], stats["job_waiters"]) == (0, 3)
+
+        api.tracker.add_job(_job(status="completed", chunks_processed=4))
+        await api.event_bus.emit_event("ingestion.completed", job_id="job-1")
+
+        responses = await asyncio.wait_for(asyncio.gather(*waits), timeout=2)
+        assert [r.status for r in responses] == ["completed"] * 3
+        assert api.event_bus.get_stats()["job_waiters"] == 0
+
+    async def test_recheck_catches_missed_events(self, load_jobs_api):
+        """Test a change without a local event (another process) is seen on the next re-read"""
+        api = load_jobs_api(job_wait_recheck_interval=0.05)
+        api.tracker.add_job(_job())
+
+        wait = asyncio.create_task(api.jobs.wait_for_job_change("job-1", timeout=30))
+        await asyncio.sleep(0.01)
+        api.tracker.add_job(_job(status="failed"))
+
+        assert (await asyncio.wait_for(wait, timeout=2)).status == "failed"
+
+    async def test_finished_job_returns_immediately(self, load_jobs_api):
+        """Test a completed job is returned unchanged without waiting"""
+        api = load_jobs_api()
+        api.tracker.add_job(_job(status="completed", chunks_processed=4))
+
+        response = await asyncio.wait_for(api.jobs.wait_for_job_change("job-1", timeout=30), timeout=1)
+
+        assert (response.status, response.changed) == ("completed", False)
+
+    async def test_unknown_job_404(self, load_jobs_api):
+        """Test waiting on an unknown job is a 404 and leaves no waiter behind"""
+        api = load_jobs_api()
+
+        with pytest.raises(api.jobs.HTTPException) as exc_info:
+            await api.jobs.wait_for_job_change("missing", timeout=1)
+
+        assert exc_info.value.status_code == 404
+        assert api.event_bus.job_waiters == {}
@@ -0,0 +1,207 @@
+"""
+Unit tests for the MCP server crawled page cache
+
+Tests how crawl_web decides whether a page needs to be ingested again:
+entries from response headers, conditional GETs (304 vs 200, missing
+validators, network errors), content hash comparison, persistence across
+instances and size-bounded eviction.
+
+Component Under Test:
+- fastmcp_server/templates/page_cache.py.j2
+"""
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def cache_module(mcp_template_module):
+    """Load the page cache template module"""
+    return mcp_template_module("page_cache")
+
+
+URL = "https://docs.example.com/guide/"
+
+
+def validating_client(etag, last_modified):
+    """Client for a server honouring If-None-Match / If-Modified-Since"""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("if-none-match") == etag or (
+            last_modified is not None and request.headers.get("if-modified-since") == last_modified
+        ):
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": etag}, content=b"<html>page</html>")
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), seen
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestPageEntry:
+    """Test cache entries built from a crawled page"""
+
+    def test_validators_from_headers(self, cache_module):
+        """Test ETag / Last-Modified are picked up case-insensitively"""
+        entry = cache_module.page_entry(
+            URL, "ab" * 32, {"etag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"}, ["/a", "/b"]
+        )
+
+        assert (entry["etag"], entry["last_modified"]) == ('"v1"', "Wed, 01 Oct 2025 00:00:00 GMT")
+        assert entry["links"] == ["/a", "/b"]
+        assert cache_module.conditional_headers(entry) == {
+            "If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Oct 2025 00:00:00 GMT"
+        }
+
+    def test_changed_at_kept_for_same_content(self, cache_module):
+        """Test changed_at only moves when the content hash differs"""
+        first = cache_module.page_entry(URL, "ab" * 32, None, [])
+        first["changed_at"] = 1.0
+
+        same = cache_module.page_entry(URL, "ab" * 32, None, [], previous=first)
+        different = cache_module.page_entry(URL, "cd" * 32, None, [], previous=first)
+
+        assert same["changed_at"] == 1.0
+        assert different["changed_at"] > 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestRevalidation:
+    """Test conditional GETs against cached validators"""
+
+    async def test_not_modified_on_304(self, cache_module, tmp_path):
+        """Test a matching ETag is sent and a 304 counts as unchanged"""
+        cache = cache_module.PageCache(str(tmp_path))
+        client, seen = validating_client('"v1"', None)
+        entry = cache_module.page_entry(URL, "ab" * 32, {"ETag": '"v1"'}, [])
+
+        async with client:
+            assert await cache.revalidate(client, URL, entry) is True
+
+        assert seen[0].headers["if-none-match"] == '"v1"'
+        assert cache.stats()["not_modified"] == 1
+
+    async def test_modified_on_200(self, cache_module, tmp_path):
+        """Test a changed validator means the page is crawled again"""
+        cache = cache_module.PageCache(str(tmp_path))
+        client, _ = validating_client('"v2"', None)
+        entry = cache_module.page_entry(URL, "ab" * 32, {"ETag": '"v1"'}, [])
+
+        async with client:
+            assert await cache.revalidate(client, URL, entry) is False
+
+    async def test_no_request_without_validators(self, cache_module):
+        """Test pages without ETag / Last-Modified are not probed"""
+        client, seen = validating_client('"v1"', None)
+        entry = cache_module.page_entry(URL, "ab" * 32, {}, [])
+
+        async with client:
+            assert await cache_module.not_modified(client, URL, entry) is False
+
+        assert seen == []
+
+    async def test_network_error_means_modified(self, cache_module):
+        """Test a failed probe falls back to a normal crawl"""
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        entry = cache_module.page_entry(URL, "ab" * 32, {"ETag": '"v1"'}, [])
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            assert await cache_module.not_modified(client, URL, entry) is False
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestPageCache:
+    """Test storage and change detection"""
+
+    async def test_content_hash_change_detection(self, cache_module, tmp_path):
+        """Test only new or changed content counts as changed"""
+        cache = cache_module.PageCache(str(tmp_path))
+        digest = cache_module.content_hash("# Guide")
+        entry = cache_module.page_entry(URL, digest, None, [])
+
+        assert cache.is_changed(None, digest) is True
+        assert cache.is_changed(entry, digest) is False
+        assert cache.is_changed(entry, cache_module.content_hash("# Guide v2")) is True
+        stats = cache.stats()
+        assert (stats["changed"], stats["content_unchanged"]) == (2, 1)
+
+    async def test_persists_across_instances(self, cache_module, tmp_path):
+        """Test entries written by one crawl are found by the next"""
+        entry = cache_module.page_entry(URL, "ab" * 32, {"ETag": '"v1"'}, ["/next"])
+        await cache_module.PageCache(str(tmp_path)).put_many({URL: entry})
+
+        cache = cache_module.PageCache(str(tmp_path))
+
+        assert await cache.get(URL) == entry
+        assert await cache.get("https://docs.example.com/other") is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    async def test_size_bound_evicts_oldest(self, cache_module, tmp_path):
+        """Test the total size stays bounded, least recently used entries go first"""
+        entries = {
+            f"{URL}{i}": cache_module.page_entry(f"{URL}{i}", "ab" * 32, None, ["/x" * 50])
+            for i in range(10)
+        }
+        size = len(cache_module.json.dumps(entries[f"{URL}0"]))
+        cache = cache_module.PageCache(str(tmp_path), max_bytes=size * 3 + 10)
+
+        await cache.put_many(entries)
+
+        assert cache.stats()["entries"] == 3
+        assert await cache.get(f"{URL}0") is None
+        assert await cache.get(f"{URL}9") is not None
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestIngestionConfirmation:
+    """Test entries are only trusted once their ingestion job completed"""
+
+    async def test_completed_job_confirms_entry(self, cache_module, tmp_path):
+        """Test a completed job marks the entry, so it is not looked up again"""
+        cache = cache_module.PageCache(str(tmp_path))
+        entry = cache_module.ingested_by(cache_module.page_entry(URL, "ab" * 32, None, []), "job-1")
+        lookups = []
+
+        async def job_completed(job_id):
+            lookups.append(job_id)
+            return True
+
+        assert await cache.confirm_ingested(entry, job_completed) is True
+        assert await cache.confirm_ingested(entry, job_completed) is True
+        assert lookups == ["job-1"]
+        assert entry["job_completed"] is True
+
+    async def test_unfinished_job_means_stale(self, cache_module, tmp_path):
+        """Test entries of failed / running jobs, or without a job, are stale"""
+        cache = cache_module.PageCache(str(tmp_path))
+        entry = cache_module.ingested_by(cache_module.page_entry(URL, "ab" * 32, None, []), "job-1")
+
+        async def job_completed(job_id):
+            return False
+
+        assert await cache.confirm_ingested(entry, job_completed) is False
+        assert await cache.confirm_ingested(cache_module.page_entry(URL, "ab" * 32, None, []), job_completed) is False
+        assert cache.stats()["stale"] == 2
+
+    def test_job_kept_for_same_content(self, cache_module):
+        """Test a recrawl with the same content keeps the confirmed job, new content drops it"""
+        confirmed = {**cache_module.ingested_by(cache_module.page_entry(URL, "ab" * 32, None, []), "job-1"),
+                     "job_completed": True}
+
+        same = cache_module.page_entry(URL, "ab" * 32, None, [], previous=confirmed)
+        different = cache_module.page_entry(URL, "cd" * 32, None, [], previous=confirmed)
+
+        assert (same["job_id"], same["job_completed"]) == ("job-1", True)
+        assert (different["job_id"], different["job_completed"]) == (None, False)
@@ -0,0 +1,244 @@
+"""
+Unit tests for the MCP server Qdrant filter compiler and payload index manager
+
+Tests compile_filter() (exact match, match-any, ranges, negation, $exists,
+$or/$not and nested keys), its validation errors, and PayloadIndexManager
+(configured indexes, usage-based auto-indexing, background retries with
+backoff, schema inference).
+
+Component Under Test:
+- fastmcp_server/templates/qdrant_filters.py.j2
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def filters_module(mcp_template_module):
+    """Load the Qdrant filter template module"""
+    return mcp_template_module("qdrant_filters")
+
+
+class RecordingIndexClient:
+    """Records create_payload_index calls (the first `fail` attempts raise)"""
+
+    def __init__(self, fail=0):
+        self.calls = []
+        self.attempts = 0
+        self.fail = fail
+
+    async def create_payload_index(self, collection_name, field_name, field_schema, wait):
+        self.attempts += 1
+        if self.attempts <= self.fail:
+            raise RuntimeError("collection not found")
+        self.calls.append((collection_name, field_name, field_schema.value, wait))
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+@pytest.mark.vector
+class TestCompileFilter:
+    """Test filter compilation"""
+
+    def test_empty_conditions(self, filters_module):
+        """Test no conditions compile to no filter"""
+        assert filters_module.compile_filter(None) is None
+        assert filters_module.compile_filter({}) is None
+
+    def test_exact_and_match_any(self, filters_module):
+        """Test scalars become MatchValue and lists become MatchAny"""
+        compiled = filters_module.compile_filter({"source_type": "web", "lang": ["en", "de"]})
+
+        exact, any_of = compiled.must
+        assert (exact.key, exact.match.value) == ("source_type", "web")
+        assert (any_of.key, any_of.match.any) == ("lang", ["en", "de"])
+
+    def test_numeric_and_datetime_ranges(self, filters_module):
+        """Test range operators compile to Range or DatetimeRange"""
+        compiled = filters_module.compile_filter({
+            "page": {"$gte": 2, "$lt": 10},
+            "created": {"$gt": "2025-01-01T00:00:00Z"},
+        })
+
+        page, created = compiled.must
+        assert (page.range.gte, page.range.lt) == (2, 10)
+        assert type(created.range).__name__ == "DatetimeRange"
+
+    def test_negation_and_exists(self, filters_module):
+        """Test $ne/$not go to must_not, $nin to MatchExcept and $exists to IsEmpty"""
+        compiled = filters_module.compile_filter({
+            "job_id": {"$ne": "abc"},
+            "tag": {"$nin": ["draft"]},
+            "summary": {"$exists": True},
+            "$not": {"source_type": "manual"},
+        })
+
+        assert compiled.must[0].match.except_ == ["draft"]
+        ne, exists, nested_not = compiled.must_not
+        assert ne.match.value == "abc"
+        assert exists.is_empty.key == "summary"
+        assert nested_not.must[0].key == "source_type"
+
+    def test_or_and_nested_keys(self, filters_module):
+        """Test $or becomes should and nested objects become dotted keys"""
+        compiled = filters_module.compile_filter({
+            "$or": [{"source_type": "web"}, {"metadata": {"author": "alice"}}]
+        })
+
+        web, author = compiled.should
+        assert web.must[0].key == "source_type"
+        assert author.must[0].key == "metadata.author"
+
+    @pytest.mark.parametrize("conditions", [
+        {"page": {"$regex": "x"}},
+        {"$and": []},
+        {"page": {"$gte": "not-a-date"}},
+        {"page": {"$gte": 1, "$lt": "2025-01-01"}},
+        {"score": 0.5},
+        {"$or": []},
+    ])
+    def test_invalid_conditions_rejected(self, filters_module, conditions):
+        """Test invalid filters raise FilterCompileError"""
+        with pytest.raises(filters_module.FilterCompileError):
+            filters_module.compile_filter(conditions)
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+@pytest.mark.vector
+class TestPayloadIndexManager:
+    """Test payload index creation"""
+
+    def test_parse_spec(self, filters_module):
+        """Test the "field:type,..." environment format"""
+        parse = filters_module.PayloadIndexManager.parse_spec
+
+        assert parse("source_type:keyword, chunk_index:integer") == {
+            "source_type": "keyword",
+            "chunk_index": "integer",
+        }
+        assert parse("") == {}
+
+    def test_unknown_schema_rejected(self, filters_module):
+        """Test unknown index types fail fast"""
+        with pytest.raises(ValueError):
+            filters_module.PayloadIndexManager(indexes={"x": "geo-hash"})
+
+    async def test_configured_indexes_created_once(self, filters_module):
+        """Test configured indexes are requested once per collection, without waiting"""
+        client = RecordingIndexClient()
+        manager = filters_module.PayloadIndexManager(indexes={"source_type": "keyword", "job_id": "keyword"})
+
+        await manager.ensure_configured(client, "docs")
+        await manager.ensure_configured(client, "docs")
+        await manager.join()
+
+        assert client.calls == [
+            ("docs", "source_type", "keyword", False),
+            ("docs", "job_id", "keyword", False),
+        ]
+
+    async def test_auto_index_after_threshold(self, filters_module):
+        """Test a field is indexed, with an inferred type, after repeated filtering"""
+        client = RecordingIndexClient()
+        manager = filters_module.PayloadIndexManager(auto_index_after=2)
+
+        await manager.observe(client, "docs", {"page": {"$gte": 3}})
+        await manager.join()
+        assert client.calls == []
+        await manager.observe(client, "docs", {"page": {"$lt": 9}})
+        await manager.observe(client, "docs", {"page": 1})
+        await manager.join()
+
+        assert client.calls == [("docs", "page", "integer", False)]
+
+    async def test_requests_do_not_block_callers(self, filters_module):
+        """Test ensure_configured returns before Qdrant answers"""
+        release = asyncio.Event()
+
+        class SlowClient(RecordingIndexClient):
+            async def create_payload_index(self, **kwargs):
+                await release.wait()
+                await super().create_payload_index(**kwargs)
+
+        client = SlowClient()
+        manager = filters_module.PayloadIndexManager(indexes={"job_id": "keyword"})
+
+        await asyncio.wait_for(manager.ensure_configured(client, "docs"), timeout=1)
+        assert manager.stats()["pending_requests"] == 1
+
+        release.set()
+        await manager.join()
+        assert client.calls == [("docs", "job_id", "keyword", False)]
+
+    async def test_failed_creation_retried_with_backoff(self, filters_module, monkeypatch):
+        """Test a failed request is retried in the background with growing delays"""
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(filters_module.asyncio, "sleep", sleep)
+        client = RecordingIndexClient(fail=3)
+        manager = filters_module.PayloadIndexManager(indexes={"job_id": "keyword"}, retry_delay=1, max_retry_delay=3)
+
+        await manager.ensure_configured(client, "docs")
+        await manager.ensure_configured(client, "docs")
+        await manager.join()
+
+        assert delays == [1, 2, 3]
+        assert client.calls == [("docs", "job_id", "keyword", False)]
+        assert manager.stats()["index_errors"] == 3
+
+    async def test_gives_up_until_cool_down(self, filters_module, monkeypatch):
+        """Test later searches do not retry a field that just exhausted its attempts"""
+        now = [1000.0]
+        monkeypatch.setattr(filters_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        client = RecordingIndexClient(fail=2)
+        manager = filters_module.PayloadIndexManager(
+            indexes={"job_id": "keyword"}, retry_delay=0, max_retry_delay=60, max_attempts=2
+        )
+
+        await manager.ensure_configured(client, "docs")
+        await manager.join()
+        await manager.ensure_configured(client, "docs")
+        await manager.join()
+
+        assert client.attempts == 2
+        assert manager.stats()["indexed_fields"] == []
+
+        now[0] += 61
+        await manager.ensure_configured(client, "docs")
+        await manager.join()
+        assert client.calls == [("docs", "job_id", "keyword", False)]
+
+    async def test_close_cancels_pending_requests(self, filters_module):
+        """Test shutdown does not wait for Qdrant"""
+        class HangingClient(RecordingIndexClient):
+            async def create_payload_index(self, **kwargs):
+                await asyncio.Event().wait()
+
+        manager = filters_module.PayloadIndexManager(indexes={"job_id": "keyword"})
+        await manager.ensure_configured(HangingClient(), "docs")
+
+        await asyncio.wait_for(manager.close(), timeout=1)
+
+        assert manager.stats()["pending_requests"] == 0
+
+    def test_schema_inference(self, filters_module):
+        """Test index types are inferred from filter operands"""
+        infer = filters_module.infer_schema
+
+        assert infer("web") == "keyword"
+        assert infer("2025-01-01T00:00:00Z") == "datetime"
+        assert infer("2025-01-01") == "datetime"
+        assert infer("20240101") == "keyword"
+        assert infer("2024") == "keyword"
+        assert infer(3) == "integer"
+        assert infer(0.5) == "float"
+        assert infer(True) == "bool"
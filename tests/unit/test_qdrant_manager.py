@@ -0,0 +1,179 @@
+"""
+Unit tests for the MCP server Qdrant client manager
+
+Tests the QdrantManager that owns the process-wide AsyncQdrantClient:
+client lifecycle, the known-collection cache, single creation of a
+collection under concurrent first writes, cache invalidation, and the
+quantization / on-disk options used for new collections.
+
+Component Under Test:
+- fastmcp_server/templates/qdrant_manager.py.j2
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def manager_module(mcp_template_module):
+    """Load the Qdrant manager template module"""
+    return mcp_template_module("qdrant_manager")
+
+
+class FakeQdrantClient:
+    """Minimal async stand-in for AsyncQdrantClient"""
+
+    def __init__(self, existing=()):
+        self.collections = set(existing)
+        self.exists_calls = 0
+        self.create_calls = []
+        self.closed = False
+
+    async def collection_exists(self, collection_name):
+        self.exists_calls += 1
+        await asyncio.sleep(0)
+        return collection_name in self.collections
+
+    async def create_collection(self, collection_name, vectors_config, quantization_config=None):
+        self.create_calls.append((collection_name, vectors_config.size))
+        self.last_create = (vectors_config, quantization_config)
+        await asyncio.sleep(0)
+        self.collections.add(collection_name)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_client():
+    return FakeQdrantClient()
+
+
+@pytest.fixture
+def manager(manager_module, fake_client, monkeypatch):
+    """QdrantManager wired to a fake client"""
+    instance = manager_module.QdrantManager(url="http://qdrant.test:6333", vector_size=4)
+    monkeypatch.setattr(instance, "_create_client", lambda: fake_client)
+    return instance
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+@pytest.mark.vector
+class TestQdrantManagerLifecycle:
+    """Test shared client lifecycle"""
+
+    async def test_connect_is_idempotent(self, manager, fake_client):
+        """Test repeated connect() keeps the same client"""
+        await manager.connect()
+        first = manager.client
+        await manager.connect()
+
+        assert manager.client is first is fake_client
+        assert manager.stats()["connected"] is True
+
+    async def test_close_releases_client_and_cache(self, manager, fake_client):
+        """Test close() closes the client and forgets known collections"""
+        await manager.ensure_collection("docs")
+        await manager.close()
+
+        assert fake_client.closed is True
+        stats = manager.stats()
+        assert stats["connected"] is False
+        assert stats["known_collections"] == []
+
+    def test_transport_reported(self, manager_module):
+        """Test stats report the configured transport"""
+        grpc = manager_module.QdrantManager(url="http://q:6333", prefer_grpc=True)
+
+        assert grpc.stats()["transport"] == "grpc"
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+@pytest.mark.vector
+class TestQdrantManagerCollectionCache:
+    """Test the collection-existence cache"""
+
+    async def test_existing_collection_checked_once(self, manager, fake_client):
+        """Test the existence check only runs on the first call"""
+        fake_client.collections.add("docs")
+
+        assert await manager.ensure_collection("docs") is False
+        assert await manager.ensure_collection("docs") is False
+
+        assert fake_client.exists_calls == 1
+        assert fake_client.create_calls == []
+        assert manager.stats()["collection_cache_hits"] == 1
+
+    async def test_concurrent_first_writes_create_once(self, manager, fake_client):
+        """Test concurrent callers create a missing collection exactly once"""
+        results = await asyncio.gather(*(manager.ensure_collection("new") for _ in range(5)))
+
+        assert results.count(True) == 1
+        assert fake_client.create_calls == [("new", 4)]
+        assert fake_client.exists_calls == 1
+        assert manager.stats()["collections_created"] == 1
+
+    async def test_forget_collection_forces_recheck(self, manager, fake_client):
+        """Test a forgotten collection is checked (and recreated) again"""
+        await manager.ensure_collection("docs")
+        fake_client.collections.discard("docs")
+        manager.forget_collection("docs")
+
+        assert await manager.ensure_collection("docs") is True
+        assert fake_client.exists_calls == 2
+        assert len(fake_client.create_calls) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+@pytest.mark.vector
+class TestQdrantManagerStorageOptions:
+    """Test quantization and on-disk options"""
+
+    def test_no_quantization_by_default(self, manager_module):
+        """Test full-precision collections and no search params by default"""
+        manager = manager_module.QdrantManager(url="http://q:6333")
+
+        assert manager.quantization_config() is None
+        assert manager.search_params is None
+        assert manager.vectors_config().on_disk is False
+
+    def test_scalar_quantization(self, manager_module):
+        """Test scalar mode yields int8 quantization and rescore params"""
+        manager = manager_module.QdrantManager(
+            url="http://q:6333", quantization="scalar", on_disk=True, oversampling=2.0
+        )
+
+        config = manager.quantization_config()
+        assert config.scalar.type.value == "int8"
+        assert config.scalar.always_ram is True
+        assert manager.vectors_config().on_disk is True
+        assert manager.search_params.quantization.rescore is True
+        assert manager.search_params.quantization.oversampling == 2.0
+
+    def test_binary_quantization(self, manager_module):
+        """Test binary mode yields binary quantization"""
+        manager = manager_module.QdrantManager(url="http://q:6333", quantization="binary")
+
+        assert manager.quantization_config().binary is not None
+
+    def test_invalid_mode_rejected(self, manager_module):
+        """Test unknown quantization modes fail fast"""
+        with pytest.raises(ValueError):
+            manager_module.QdrantManager(url="http://q:6333", quantization="pq")
+
+    async def test_created_collection_uses_options(self, manager_module, fake_client, monkeypatch):
+        """Test ensure_collection passes the storage options to Qdrant"""
+        manager = manager_module.QdrantManager(url="http://q:6333", quantization="scalar", on_disk=True)
+        monkeypatch.setattr(manager, "_create_client", lambda: fake_client)
+
+        await manager.ensure_collection("docs")
+
+        vectors_config, quantization_config = fake_client.last_create
+        assert vectors_config.on_disk is True
+        assert quantization_config.scalar is not None
@@ -0,0 +1,228 @@
+"""
+Unit tests for compressed request bodies between MCP server and orchestrator
+
+Tests the MCP-side RequestCompressor (threshold, negotiation via the
+Accept-Encoding response header, 415 handling) and the orchestrator's
+streaming RequestDecompressionMiddleware, end to end over ASGI.
+
+Component Under Test:
+- fastmcp_server/templates/request_compression.py.j2
+- orchestrator_fastapi/templates/utils/request_compression.py.j2
+"""
+
+import gzip
+import importlib.util
+import json
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+ORCHESTRATOR_UTILS = (
+    Path(__file__).parent.parent.parent / "roles" / "orchestrator_fastapi" / "templates" / "utils"
+)
+
+
+@pytest.fixture
+def compression_module(mcp_template_module):
+    """Load the MCP server request compression template module"""
+    return mcp_template_module("request_compression")
+
+
+@pytest.fixture(scope="module")
+def middleware_module():
+    """Load the orchestrator decompression middleware template (Jinja-free)"""
+    loader = SourceFileLoader(
+        "orchestrator_request_compression", str(ORCHESTRATOR_UTILS / "request_compression.py.j2")
+    )
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def orchestrator(middleware_module):
+    """ASGI client for an app echoing the size of the JSON body it parsed"""
+
+    async def ingest(request: Request) -> JSONResponse:
+        payload = await request.json()
+        return JSONResponse({
+            "chars": len(payload["content"]),
+            "content_encoding": request.headers.get("content-encoding")
+        })
+
+    app = Starlette(routes=[Route("/lightrag/ingest-async", ingest, methods=["POST"])])
+    app.add_middleware(middleware_module.RequestDecompressionMiddleware, max_size=1024 * 1024)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://orchestrator")
+
+
+def body_of(size: int) -> bytes:
+    return json.dumps({"content": "lorem ipsum " * (size // 12)}).encode("utf-8")
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestRequestCompressor:
+    """Test client-side negotiation and thresholds"""
+
+    async def test_uncompressed_until_upstream_advertises(self, compression_module):
+        """Test bodies stay plain JSON until an Accept-Encoding header was seen"""
+        compressor = compression_module.RequestCompressor(preferred=["gzip"], min_size=100)
+
+        content, headers = await compressor.encode(body_of(1000))
+        assert headers == {}
+        assert compressor.stats()["skipped"] == 1
+
+        compressor.observe({"accept-encoding": "br;q=0, gzip, deflate"})
+        content, headers = await compressor.encode(body_of(1000))
+
+        assert headers == {"Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(content)) == json.loads(body_of(1000))
+        assert compressor.stats()["ratio"] < 0.5
+
+    async def test_small_bodies_not_compressed(self, compression_module):
+        """Test bodies under min_size are sent as-is"""
+        compressor = compression_module.RequestCompressor(preferred=["gzip"], min_size=10_000)
+        compressor.observe({"accept-encoding": "gzip"})
+
+        _, headers = await compressor.encode(body_of(500))
+
+        assert headers == {}
+
+    def test_preference_limited_to_shared_encodings(self, compression_module):
+        """Test the first preferred encoding both sides support is chosen, and 415 drops it"""
+        compressor = compression_module.RequestCompressor(preferred=["zstd", "gzip"], min_size=0)
+        compressor.observe({"accept-encoding": "gzip, deflate"})
+
+        assert compressor.choose(10) == "gzip"
+
+        compressor.reject("gzip")
+        assert compressor.choose(10) is None
+
+    def test_q_zero_excluded(self, compression_module):
+        """Test q=0 entries of Accept-Encoding are not treated as supported"""
+        assert compression_module.parse_accept_encoding("zstd;q=0, gzip;q=0.5") == {"gzip"}
+
+
+@pytest.mark.unit
+@pytest.mark.fast
+class TestRequestDecompressionMiddleware:
+    """Test the orchestrator middleware against real compressed bodies"""
+
+    async def test_gzip_round_trip(self, compression_module, orchestrator):
+        """Test a negotiated gzip body is decoded before the route parses it"""
+        compressor = compression_module.RequestCompressor(preferred=["gzip"], min_size=1024)
+        body = body_of(200_000)
+
+        async with orchestrator as client:
+            probe = await client.post("/lightrag/ingest-async", content=body_of(10))
+            compressor.observe(probe.headers)
+            content, headers = await compressor.encode(body)
+            response = await client.post(
+                "/lightrag/ingest-async", content=content,
+                headers={"Content-Type": "application/json", **headers}
+            )
+
+        assert headers["Content-Encoding"] == "gzip"
+        assert len(content) < len(body) / 10
+        assert response.status_code == 200
+        assert response.json() == {"chars": len(json.loads(body)["content"]), "content_encoding": None}
+
+    async def test_unsupported_encoding_rejected_with_415(self, orchestrator):
+        """Test unknown encodings get 415 listing the supported ones"""
+        async with orchestrator as client:
+            response = await client.post(
+                "/lightrag/ingest-async", content=b"xx", headers={"Content-Encoding": "br"}
+            )
+
+        assert response.status_code == 415
+        assert "gzip" in response.headers["accept-encoding"]
+
+    async def test_decompression_bomb_rejected(self, orchestrator):
+        """Test bodies expanding past max_size are refused with 413"""
+        bomb = gzip.compress(b"0" * (4 * 1024 * 1024))
+
+        async with orchestrator as client:
+            response = await client.post(
+                "/lightrag/ingest-async", content=bomb, headers={"Content-Encoding": "gzip"}
+            )
+
+        assert response.status_code == 413
+
+    async def test_corrupt_body_rejected(self, orchestrator):
+        """Test a body that is not valid gzip gets 400"""
+        async with orchestrator as client:
+            response = await client.post(
+                "/lightrag/ingest-async", content=b"not gzip at all", headers={"Content-Encoding": "gzip"}
+            )
+
+        assert response.status_code == 400
+
+    async def test_zstd_decompression_bomb_rejected(self, orchestrator):
+        """Test a zstd body expanding past max_size is refused with 413"""
+        zstandard = pytest.importorskip("zstandard")
+        bomb = zstandard.ZstdCompressor().compress(b"0" * (16 * 1024 * 1024))
+
+        async with orchestrator as client:
+            response = await client.post(
+                "/lightrag/ingest-async", content=bomb, headers={"Content-Encoding": "zstd"}
+            )
+
+        assert response.status_code == 413
+
+    @pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+    async def test_truncated_body_rejected(self, orchestrator, encoding):
+        """Test a body cut off mid-stream gets 400 for every encoding"""
+        if encoding == "zstd":
+            compressed = pytest.importorskip("zstandard").ZstdCompressor().compress(body_of(100_000))
+        else:
+            compressed = gzip.compress(body_of(100_000))
+
+        async with orchestrator as client:
+            response = await client.post(
+                "/lightrag/ingest-async", content=compressed[:len(compressed) // 2],
+                headers={"Content-Encoding": encoding}
+            )
+
+        assert response.status_code == 400
+        assert "truncated" in response.text
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+class TestBoundedDecoders:
+    """Test decoders stop producing output once max_size is exceeded"""
+
+    @pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+    def test_output_bounded_by_max_size(self, middleware_module, encoding):
+        """Test one small compressed chunk cannot expand far past max_size"""
+        if encoding == "zstd":
+            pytest.importorskip("zstandard")
+            compressed = middleware_module.zstandard.ZstdCompressor().compress(b"0" * (64 * 1024 * 1024))
+        else:
+            compressed = gzip.compress(b"0" * (64 * 1024 * 1024))
+        max_size = 1024 * 1024
+        decoder = middleware_module.supported_decoders()[encoding](max_size)
+
+        with pytest.raises(middleware_module.DecompressedTooLarge):
+            decoder.decompress(compressed)
+
+        assert decoder._output.total <= max_size + middleware_module.DECODE_STEP
+
+    def test_zstd_multiple_frames(self, middleware_module):
+        """Test concatenated zstd frames decode completely"""
+        zstandard = pytest.importorskip("zstandard")
+        compressor = zstandard.ZstdCompressor(write_checksum=True)
+        compressed = compressor.compress(b"first ") + compressor.compress(b"second")
+        decoder = middleware_module.supported_decoders()["zstd"](1024)
+
+        body = b"".join(decoder.decompress(compressed[i:i + 3]) for i in range(0, len(compressed), 3))
+
+        assert body + decoder.finish() == b"first second"
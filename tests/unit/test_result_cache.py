@@ -0,0 +1,106 @@
+"""
+Unit tests for the MCP server query result cache
+
+Tests the QueryResultCache used by lightrag_query: key normalization, TTL
+expiry, LRU eviction and invalidation on a corpus generation change.
+
+Component Under Test:
+- fastmcp_server/templates/result_cache.py.j2
+"""
+
+import pytest
+
+
+@pytest.fixture
+def cache_module(mcp_template_module):
+    """Load the query result cache template module"""
+    return mcp_template_module("result_cache")
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+RESULT = {"status": "success", "mode": "hybrid", "response": "answer", "context": []}
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestQueryResultCache:
+    """Test lightrag_query result caching"""
+
+    def test_key_normalizes_query(self, cache_module):
+        """Test case and whitespace differences map to the same key"""
+        make_key = cache_module.QueryResultCache.make_key
+
+        assert make_key("  What is  LightRAG?", "hybrid", False) == make_key("what is lightrag?", "hybrid", False)
+        assert make_key("What is LightRAG?", "hybrid", False) != make_key("What is LightRAG?", "local", False)
+        assert make_key("What is LightRAG?", "hybrid", False) != make_key("What is LightRAG?", "hybrid", True)
+
+    def test_miss_then_hit(self, cache_module):
+        """Test a stored result is returned for the same generation"""
+        cache = cache_module.QueryResultCache()
+        key = cache.make_key("q", "hybrid", False)
+
+        assert cache.get(key, 1) is None
+        cache.put(key, 1, RESULT)
+
+        assert cache.get(key, 1) == RESULT
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["corpus_generation"] == 1
+
+    def test_entries_expire_after_ttl(self, cache_module):
+        """Test an entry older than the TTL is a miss"""
+        clock = FakeClock()
+        cache = cache_module.QueryResultCache(ttl_seconds=60, clock=clock)
+        key = cache.make_key("q", "hybrid", False)
+        cache.put(key, 1, RESULT)
+
+        clock.now += 59
+        assert cache.get(key, 1) == RESULT
+        clock.now += 2
+        assert cache.get(key, 1) is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_new_generation_invalidates_everything(self, cache_module):
+        """Test results from before an ingestion are never served"""
+        cache = cache_module.QueryResultCache()
+        key = cache.make_key("q", "hybrid", False)
+        cache.put(key, 1, RESULT)
+
+        assert cache.get(key, 2) is None
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["invalidations"] == 1
+
+    def test_result_from_older_generation_not_stored(self, cache_module):
+        """Test a query that started before an ingestion finished is not cached"""
+        cache = cache_module.QueryResultCache()
+        key = cache.make_key("q", "hybrid", False)
+        assert cache.get(key, 2) is None
+
+        cache.put(key, 1, RESULT)
+
+        assert cache.get(key, 2) is None
+
+    def test_lru_eviction(self, cache_module):
+        """Test the least recently used entry is evicted past max_entries"""
+        cache = cache_module.QueryResultCache(max_entries=2)
+        first, second, third = (cache.make_key(q, "hybrid", False) for q in ("a", "b", "c"))
+        cache.put(first, 1, RESULT)
+        cache.put(second, 1, RESULT)
+        cache.get(first, 1)
+
+        cache.put(third, 1, RESULT)
+
+        assert cache.get(first, 1) == RESULT
+        assert cache.get(second, 1) is None
+        assert cache.get(third, 1) == RESULT
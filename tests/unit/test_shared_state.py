@@ -0,0 +1,163 @@
+"""
+Unit tests for the MCP server cross-worker shared state
+
+Tests SharedState used in multi-worker mode: publishing local breaker
+trips, mirroring trips and recoveries from other workers, the JSON cache
+store and tolerance of Redis errors.
+
+Component Under Test:
+- fastmcp_server/templates/shared_state.py.j2
+"""
+
+import asyncio
+import pytest
+from common_types import CircuitBreakerStateEnum
+
+
+@pytest.fixture
+def breaker_module(mcp_template_module):
+    """Load the async circuit breaker template module"""
+    return mcp_template_module("async_circuit_breaker")
+
+
+@pytest.fixture
+def shared_module(mcp_template_module, breaker_module):
+    """Load the shared state template module (imports async_circuit_breaker)"""
+    return mcp_template_module("shared_state")
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio client methods SharedState uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        self._check()
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    async def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    async def aclose(self):
+        pass
+
+
+def make_worker(shared_module, breaker_module, redis, worker_id, listener_target):
+    """One worker: a breaker whose listener feeds the worker's SharedState"""
+    breaker = breaker_module.AsyncCircuitBreaker(
+        name="orchestrator_query",
+        fail_max=1,
+        reset_timeout=60,
+        listener=lambda *args: listener_target[0].on_breaker_transition(*args)
+    )
+    state = shared_module.SharedState("redis://unused", worker_id=worker_id, client=redis)
+    listener_target[0] = state
+    state.attach_breakers({"query": breaker})
+    return breaker, state
+
+
+async def _fail():
+    raise RuntimeError("orchestrator down")
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestSharedBreakers:
+    """Test breaker state sharing between workers"""
+
+    async def test_trip_propagates_to_other_worker(self, shared_module, breaker_module):
+        """Test a breaker opening in one worker opens it in the others for the remaining time"""
+        redis = FakeRedis()
+        breaker_a, state_a = make_worker(shared_module, breaker_module, redis, "a", [None])
+        breaker_b, state_b = make_worker(shared_module, breaker_module, redis, "b", [None])
+
+        with pytest.raises(RuntimeError):
+            await breaker_a.call(_fail)
+        await asyncio.sleep(0)  # let the publish task run
+        await state_b.sync_breakers()
+
+        assert breaker_b.current_state == CircuitBreakerStateEnum.OPEN
+        assert 55 < breaker_b.seconds_until_half_open() <= 60
+        assert state_a.stats()["published"] == 1
+        assert state_b.stats()["remote_trips"] == 1
+        assert state_b.stats()["published"] == 0
+
+    async def test_recovery_propagates_to_remotely_tripped_worker(self, shared_module, breaker_module):
+        """Test a worker that was only tripped remotely closes when the origin worker recovers"""
+        redis = FakeRedis()
+        breaker_a, _ = make_worker(shared_module, breaker_module, redis, "a", [None])
+        breaker_b, state_b = make_worker(shared_module, breaker_module, redis, "b", [None])
+
+        with pytest.raises(RuntimeError):
+            await breaker_a.call(_fail)
+        await asyncio.sleep(0)
+        await state_b.sync_breakers()
+
+        breaker_a.reset()
+        await asyncio.sleep(0)
+        await state_b.sync_breakers()
+
+        assert breaker_b.current_state == CircuitBreakerStateEnum.CLOSED
+        assert state_b.stats()["remote_closes"] == 1
+
+    async def test_own_published_state_ignored(self, shared_module, breaker_module):
+        """Test a worker does not re-apply its own published trip"""
+        redis = FakeRedis()
+        breaker_a, state_a = make_worker(shared_module, breaker_module, redis, "a", [None])
+
+        with pytest.raises(RuntimeError):
+            await breaker_a.call(_fail)
+        await asyncio.sleep(0)
+        breaker_a.reset()
+        await asyncio.sleep(0)
+        await state_a.sync_breakers()
+
+        assert breaker_a.current_state == CircuitBreakerStateEnum.CLOSED
+        assert state_a.stats()["remote_trips"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestSharedCache:
+    """Test the JSON key/value store"""
+
+    async def test_json_round_trip(self, shared_module):
+        """Test values stored by one worker are read by another"""
+        redis = FakeRedis()
+        state_a = shared_module.SharedState("redis://unused", worker_id="a", client=redis)
+        state_b = shared_module.SharedState("redis://unused", worker_id="b", client=redis)
+        key = state_a.cache_key("query", [3, "what is rag", "hybrid", False])
+
+        await state_a.set_json(key, {"status": "success", "response": "text"}, ttl=60)
+
+        assert state_b.cache_key("query", [3, "what is rag", "hybrid", False]) == key
+        assert await state_b.get_json(key) == {"status": "success", "response": "text"}
+        assert await state_b.get_json(state_b.cache_key("query", [4, "what is rag", "hybrid", False])) is None
+        assert state_b.stats()["cache_hits"] == 1
+        assert state_b.stats()["cache_misses"] == 1
+
+    async def test_redis_errors_are_misses(self, shared_module, breaker_module):
+        """Test Redis failures never raise into tools"""
+        redis = FakeRedis()
+        redis.fail = True
+        breaker, state = make_worker(shared_module, breaker_module, redis, "a", [None])
+
+        await state.set_json("k", {"a": 1}, ttl=1)
+        assert await state.get_json("k") is None
+        await state.sync_breakers()
+
+        assert breaker.current_state == CircuitBreakerStateEnum.CLOSED
+        assert state.stats()["errors"] == 3
@@ -0,0 +1,97 @@
+"""
+Unit tests for the MCP server single-flight layer
+
+Tests the SingleFlight deduplication used by qdrant_find and lightrag_query:
+key canonicalization, coalescing of concurrent identical calls, error
+propagation and per-caller timeouts.
+
+Component Under Test:
+- fastmcp_server/templates/single_flight.py.j2
+"""
+
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def flight_module(mcp_template_module):
+    """Load the single-flight template module"""
+    return mcp_template_module("single_flight")
+
+
+@pytest.mark.unit
+@pytest.mark.mcp
+@pytest.mark.fast
+class TestSingleFlight:
+    """Test in-flight call deduplication"""
+
+    def test_key_ignores_argument_order(self, flight_module):
+        """Test canonical keys do not depend on dict ordering"""
+        key = flight_module.canonical_key
+
+        assert key("qdrant_find", {"query": "q", "limit": 5, "filter_conditions": {"a": 1, "b": 2}}) == key(
+            "qdrant_find", {"filter_conditions": {"b": 2, "a": 1}, "limit": 5, "query": "q"}
+        )
+        assert key("qdrant_find", {"query": "q"}) != key("lightrag_query", {"query": "q"})
+        assert key("qdrant_find", {"query": "q"}) != key("qdrant_find", {"query": "Q"})
+
+    async def test_concurrent_identical_calls_run_once(self, flight_module):
+        """Test the first caller runs the work and the others share its result"""
+        flight = flight_module.SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"status": "success"}
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result == {"status": "success"} for result in results)
+        stats = flight.stats()
+        assert stats["leaders"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    async def test_sequential_calls_are_not_coalesced(self, flight_module):
+        """Test a completed call is not reused by later callers"""
+        flight = flight_module.SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", work) == 1
+        assert await flight.do("k", work) == 2
+
+    async def test_error_reaches_every_caller(self, flight_module):
+        """Test an exception from the shared call is raised to all callers"""
+        flight = flight_module.SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("qdrant down")
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_caller_timeout_does_not_cancel_shared_call(self, flight_module):
+        """Test a caller with a short timeout gives up while others still get the result"""
+        flight = flight_module.SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.1)
+            return "done"
+
+        patient = asyncio.ensure_future(flight.do("k", work, timeout=5))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await flight.do("k", work, timeout=0.01)
+
+        assert await patient == "done"
+        assert flight.stats()["timeouts"] == 1